@@ -0,0 +1,249 @@
+"""Columnar export and analytics of application history.
+
+Streams `history/applications.jsonl` in chunks into CSV (and Parquet when
+pyarrow is installed), writes per-job answered and unanswered questions
+alongside, and builds an Excel report. Only the running aggregates and phase
+timings are kept in memory, never the full history. Run from the repo root:
+
+    python -m db.export --out exports --chunksize 50000
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from db.models import HISTORY_FILE, PHASES
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+    pq = None
+
+COLUMNS = [
+    "job_id",
+    "title",
+    "company",
+    "applied_at",
+    "status",
+    "form_fingerprint",
+    "steps",
+    "questions_answered",
+    "questions_unanswered",
+] + [f"phase_{phase}" for phase in PHASES]
+DTYPES = {
+    "job_id": "string",
+    "title": "string",
+    "company": "string",
+    "status": "string",
+    "form_fingerprint": "string",
+    "steps": "Int64",
+    "questions_answered": "Int64",
+    "questions_unanswered": "Int64",
+    **{f"phase_{phase}": "float64" for phase in PHASES},
+}
+QUESTION_COLUMNS = ["job_id", "status", "form_fingerprint", "question", "answered"]
+QUESTION_DTYPES = {
+    "job_id": "string",
+    "status": "string",
+    "form_fingerprint": "string",
+    "question": "string",
+    "answered": "boolean",
+}
+PERCENTILES = [50, 90, 95, 99]
+COUNT_COLUMNS = ["applications", "applied", "skipped"]
+
+
+def iter_history(path=HISTORY_FILE, chunksize=50_000):
+    """Yield (applications, questions) DataFrames, one pair per chunk."""
+    for raw in pd.read_json(path, lines=True, chunksize=chunksize, dtype=False):
+        timings = pd.json_normalize(raw["phase_timings"].tolist()).reindex(
+            columns=PHASES
+        )
+        timings.columns = [f"phase_{phase}" for phase in PHASES]
+        timings.index = raw.index
+
+        apps = raw.assign(
+            applied_at=pd.to_datetime(raw["applied_at"]),
+            questions_unanswered=raw["unanswered_questions"].str.len(),
+        ).join(timings)
+        # Fixed dtypes keep the Parquet schema identical across chunks
+        apps = apps.reindex(columns=COLUMNS).astype(DTYPES)
+
+        questions = pd.concat(
+            [
+                _question_rows(raw, "answered_questions", True),
+                _question_rows(raw, "unanswered_questions", False),
+            ]
+        )
+        questions = questions.reindex(columns=QUESTION_COLUMNS).astype(
+            QUESTION_DTYPES
+        )
+        yield apps, questions
+
+
+def _question_rows(raw, column, answered):
+    """One row per (job, question) in `column`, flagged with `answered`."""
+    if column not in raw:  # Records written before the column existed
+        return pd.DataFrame(columns=QUESTION_COLUMNS)
+    return (
+        raw[["job_id", "status", "form_fingerprint", column]]
+        .explode(column)
+        .dropna(subset=[column])
+        .rename(columns={column: "question"})
+        .assign(answered=answered)
+    )
+
+
+class HistoryReport:
+    """Running aggregates updated chunk by chunk."""
+
+    def __init__(self):
+        self.per_hour = pd.Series(dtype="int64")
+        self.by_company = pd.DataFrame(columns=COUNT_COLUMNS)
+        self.by_fingerprint = pd.DataFrame(columns=COUNT_COLUMNS)
+        self.phase_values = {phase: [] for phase in PHASES}
+
+    def update(self, apps):
+        applied = apps[apps["status"] == "applied"]
+        hours = applied["applied_at"].dt.floor("h").value_counts()
+        self.per_hour = self.per_hour.add(hours, fill_value=0)
+
+        self.by_company = self._add_counts(self.by_company, apps, "company")
+        self.by_fingerprint = self._add_counts(
+            self.by_fingerprint, apps, "form_fingerprint"
+        )
+
+        for phase in PHASES:
+            values = apps[f"phase_{phase}"].dropna().to_numpy(dtype=np.float32)
+            self.phase_values[phase].append(values)
+
+    @staticmethod
+    def _add_counts(total, apps, key):
+        # Skipped jobs had no form to fill, so they don't count as applications
+        counts = (
+            apps.assign(
+                attempted=apps["status"] != "skipped",
+                applied=apps["status"] == "applied",
+                skipped=apps["status"] == "skipped",
+            )
+            .groupby(apps[key].fillna("unknown"))
+            .agg(
+                applications=("attempted", "sum"),
+                applied=("applied", "sum"),
+                skipped=("skipped", "sum"),
+            )
+        )
+        return total.add(counts, fill_value=0)
+
+    def tables(self):
+        per_hour = (
+            self.per_hour.sort_index()
+            .astype("int64")
+            .rename_axis("hour")
+            .rename("applications")
+            .reset_index()
+        )
+
+        rows = []
+        for phase, chunks in self.phase_values.items():
+            values = np.concatenate(chunks) if chunks else np.array([])
+            row = {"phase": phase, "samples": len(values)}
+            for p in PERCENTILES:
+                row[f"p{p}_s"] = (
+                    round(float(np.percentile(values, p)), 3) if len(values) else None
+                )
+            rows.append(row)
+        phases = pd.DataFrame(rows)
+
+        return {
+            "Applications per hour": per_hour,
+            "Phase percentiles": phases,
+            "By company": self._with_rate(self.by_company, "company"),
+            "By form fingerprint": self._with_rate(
+                self.by_fingerprint, "form_fingerprint"
+            ),
+        }
+
+    @staticmethod
+    def _with_rate(counts, key):
+        counts = counts.astype("int64")
+        counts["success_rate"] = (counts["applied"] / counts["applications"]).round(3)
+        return (
+            counts.sort_values("applications", ascending=False)
+            .rename_axis(key)
+            .reset_index()
+        )
+
+
+def export_history(path=HISTORY_FILE, out_dir="exports", chunksize=50_000):
+    """Stream the history into columnar files and return the report tables."""
+    if not os.path.exists(path):
+        print(f"⚠️ No application history found at {path}")
+        return {}
+
+    os.makedirs(out_dir, exist_ok=True)
+    apps_csv = os.path.join(out_dir, "applications.csv")
+    questions_csv = os.path.join(out_dir, "questions.csv")
+    for stale in (apps_csv, questions_csv):
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    if pq is None:
+        print("ℹ️ pyarrow is not installed; skipping Parquet output.")
+    writers = {}
+    report = HistoryReport()
+    rows = 0
+
+    try:
+        for apps, questions in iter_history(path, chunksize):
+            first = rows == 0
+            apps.to_csv(apps_csv, mode="a", header=first, index=False)
+            questions.to_csv(questions_csv, mode="a", header=first, index=False)
+            if pq is not None:
+                _write_parquet(writers, out_dir, "applications", apps)
+                _write_parquet(writers, out_dir, "questions", questions)
+
+            report.update(apps)
+            rows += len(apps)
+            print(f"📦 Exported {rows} applications...")
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    tables = report.tables()
+    report_path = os.path.join(out_dir, "report.xlsx")
+    with pd.ExcelWriter(report_path, engine="openpyxl") as writer:
+        for sheet, table in tables.items():
+            table.to_excel(writer, sheet_name=sheet[:31], index=False)
+    print(f"💾 Wrote {rows} applications to {out_dir}/ (report: {report_path})")
+    return tables
+
+
+def _write_parquet(writers, out_dir, name, frame):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    if name not in writers:
+        writers[name] = pq.ParquetWriter(
+            os.path.join(out_dir, f"{name}.parquet"), table.schema
+        )
+    writers[name].write_table(table.cast(writers[name].schema))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--input", default=HISTORY_FILE)
+    parser.add_argument("--out", default="exports")
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args()
+
+    tables = export_history(args.input, args.out, args.chunksize)
+    for name in ("Phase percentiles", "By company"):
+        if name in tables:
+            print(f"\n{name}")
+            print(tables[name].head(15).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
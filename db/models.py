@@ -1,11 +1,18 @@
 """Database models for linkedin-easy-apply
-A simple dataclass representing a job application record.
+A simple dataclass representing a job application record, persisted as
+one JSON line per application so history can be streamed back in chunks.
 """
 
-from dataclasses import dataclass
+import json
+import os
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Optional
 
+HISTORY_FILE = "history/applications.jsonl"
+# Phases timed for every application, in the order they happen
+PHASES = ["navigate", "open_modal", "fill", "advance", "submit", "rate_limit_wait"]
+
 
 @dataclass
 class JobApplication:
@@ -15,11 +22,17 @@ class JobApplication:
     applied_at: datetime
     status: str
     notes: Optional[str] = None
+    phase_timings: dict[str, float] = field(default_factory=dict)
+    form_fingerprint: Optional[str] = None
+    steps: int = 0
+    questions_answered: int = 0
+    answered_questions: list[str] = field(default_factory=list)
+    unanswered_questions: list[str] = field(default_factory=list)
 
 
-# Simple in-memory store for now
-APPLICATIONS = []
-
-
-def record_application(app: JobApplication) -> None:
-    APPLICATIONS.append(app)
+def record_application(app: JobApplication, path: str = HISTORY_FILE) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    record = asdict(app)
+    record["applied_at"] = app.applied_at.isoformat()
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
@@ -0,0 +1,224 @@
+"""Load-test `apply_easy_apply_job` against the synthetic Easy Apply site.
+
+Starts the site locally, then runs the applier with each requested level
+of concurrency (one browser per worker process). Reports jobs/minute,
+correctness of the filled answers, and how throughput scales. Run from the
+repo root (the applier reads config.yaml):
+
+    python -m loadtest.run --jobs 200 --concurrency 1,2,4
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from loadtest.site import SyntheticSite
+
+
+def _worker(base_url, job_ids, resume_path, ratelimit_db, paced, headless):
+    """Apply to `job_ids` in one browser; return [(job_id, success, seconds)]."""
+    from playwright.sync_api import sync_playwright
+
+    import utils.apply as apply
+    import utils.humanize as humanize
+    import utils.ratelimit as ratelimit
+
+    if not paced:
+        # Measure the applier itself, not the human-like pacing
+        humanize.config.update(
+            min_action_delay=0,
+            max_action_delay=0,
+            settle_delay_min=0,
+            settle_delay_max=0,
+        )
+        ratelimit.RATE_LIMIT_ENABLED = False
+    # Never spend the real account's tokens or skew its wait metrics
+    ratelimit.DB_PATH = ratelimit_db
+    apply.RESUME_PATH = resume_path
+    apply.PHONE = apply.PHONE or "5550100"
+    apply.EMAIL = apply.EMAIL or "loadtest@example.com"
+
+    results = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        page = browser.new_page()
+        for job_id in job_ids:
+            job = {
+                "job_id": str(job_id),
+                "title": f"Synthetic job {job_id}",
+                "company": "Synthetic",
+                "link": f"{base_url}/jobs/view/{job_id}/",
+            }
+            apply.current_job = apply.JobRun()
+            start = time.perf_counter()
+            try:
+                success = apply.apply_easy_apply_job(page, job)
+            except Exception as e:
+                print(f"⚠️ Job {job_id} raised: {e}")
+                success = False
+            results.append((job_id, success, time.perf_counter() - start))
+        browser.close()
+    return results
+
+
+def expected_answers(resume_path):
+    """Correct answer per question kind, taken from the configured profile."""
+    import utils.apply as apply
+
+    return {
+        "phone": apply.PHONE or "5550100",
+        "email": apply.EMAIL or "loadtest@example.com",
+        "resume": os.path.basename(resume_path),
+        "years_experience": str(apply.YEARS_OF_EXPERIENCE),
+        "notice_period": str(apply.NOTICE_PERIOD),
+        "notice_period_months": str(round(int(apply.NOTICE_PERIOD) / 30, 2)),
+        "current_salary": str(apply.CURRENT_SALARY),
+        "salary_expectation": str(apply.SALARY_EXPECTATION),
+        "free_text": "",
+        "work_authorization": str(apply.WORK_AUTHORIZATION),
+        "sponsorship": str(apply.REQUIRE_SPONSORSHIP),
+        "relocate": str(apply.WILLING_TO_RELOCATE),
+        "previously_worked": str(apply.PREVIOUSLY_WORKED),
+        "education": str(apply.EDUCATION_LEVEL),
+    }
+
+
+def score_job(spec, submission, expected):
+    """Return (correct_fields, total_fields) for one submitted job."""
+    answers = submission["answers"] if submission else {}
+    correct = total = 0
+    for step in spec["steps"]:
+        for field in step:
+            total += 1
+            got = answers.get(field["id"], "")
+            # Radios/selects may use opaque values; compare their visible text
+            got = dict(field.get("options", [])).get(got, got)
+            if _same(got, expected[field["kind"]]):
+                correct += 1
+    return correct, total
+
+
+def _same(got, want):
+    got, want = str(got).strip().lower(), str(want).strip().lower()
+    if got == want:
+        return True
+    try:
+        return float(got) == float(want)
+    except ValueError:
+        return False
+
+
+def run_level(site, base_url, job_ids, concurrency, resume_path, paced, headless):
+    chunks = [job_ids[i::concurrency] for i in range(concurrency)]
+    ctx = multiprocessing.get_context("spawn")
+    # Workers of one level share a fresh rate-limit DB, like processes in production
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        ratelimit_db = f.name
+    start = time.perf_counter()
+    try:
+        with ctx.Pool(concurrency) as pool:
+            batches = pool.starmap(
+                _worker,
+                [
+                    (base_url, chunk, resume_path, ratelimit_db, paced, headless)
+                    for chunk in chunks
+                ],
+            )
+    finally:
+        os.remove(ratelimit_db)
+    elapsed = time.perf_counter() - start
+    # Beacons are fire-and-forget; give the last ones a moment to land
+    time.sleep(1)
+
+    results = [r for batch in batches for r in batch]
+    expected = expected_answers(resume_path)
+    fields_correct = fields_total = jobs_correct = 0
+    for job_id, _, _ in results:
+        submission = site.submissions.get(job_id)
+        correct, total = score_job(site.spec(job_id), submission, expected)
+        fields_correct += correct
+        fields_total += total
+        jobs_correct += bool(submission) and correct == total
+
+    return {
+        "concurrency": concurrency,
+        "jobs": len(results),
+        "submitted": sum(1 for job_id, _, _ in results if job_id in site.submissions),
+        "reported_success": sum(1 for _, success, _ in results if success),
+        "jobs_per_min": len(results) / elapsed * 60 if elapsed else 0.0,
+        "field_accuracy": fields_correct / fields_total if fields_total else 0.0,
+        "job_accuracy": jobs_correct / len(results) if results else 0.0,
+        "avg_job_s": sum(s for _, _, s in results) / len(results) if results else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--jobs", type=int, default=100, help="jobs per level")
+    parser.add_argument("--concurrency", default="1,2,4")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-latency-ms", type=int, default=0)
+    parser.add_argument("--step-latency-ms", type=int, default=0)
+    parser.add_argument(
+        "--paced", action="store_true", help="keep configured delays and rate limits"
+    )
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    site = SyntheticSite(args.seed, args.max_latency_ms, args.step_latency_ms)
+    server = site.serve()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    print(f"🌐 Synthetic site running at {base_url}")
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(b"%PDF-1.4\n% synthetic resume\n")
+        resume_path = f.name
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+    reports = []
+    try:
+        for n, concurrency in enumerate(levels):
+            # Fresh job ids per level so submissions don't overlap
+            job_ids = list(range(n * args.jobs, (n + 1) * args.jobs))
+            print(f"🚀 Running {args.jobs} jobs with concurrency {concurrency}...")
+            reports.append(
+                run_level(
+                    site,
+                    base_url,
+                    job_ids,
+                    concurrency,
+                    resume_path,
+                    args.paced,
+                    not args.headed,
+                )
+            )
+    finally:
+        server.shutdown()
+        os.remove(resume_path)
+
+    baseline = reports[0]["jobs_per_min"] if reports else 0
+    print(
+        f"\n{'conc':>4} {'jobs':>5} {'submitted':>9} {'reported':>8} "
+        f"{'jobs/min':>9} {'speedup':>8} {'field acc':>9} {'job acc':>8} "
+        f"{'avg s/job':>9}"
+    )
+    for r in reports:
+        speedup = r["jobs_per_min"] / baseline if baseline else 0
+        print(
+            f"{r['concurrency']:>4} {r['jobs']:>5} {r['submitted']:>9} "
+            f"{r['reported_success']:>8} {r['jobs_per_min']:>9.1f} "
+            f"{speedup:>7.2f}x {r['field_accuracy']:>9.1%} "
+            f"{r['job_accuracy']:>8.1%} {r['avg_job_s']:>9.2f}"
+        )
+    for r in reports:
+        if r["reported_success"] != r["submitted"]:
+            print(
+                f"⚠️ Concurrency {r['concurrency']}: applier reported "
+                f"{r['reported_success']} successes but the site received "
+                f"{r['submitted']} submissions"
+            )
+
+
+if __name__ == "__main__":
+    main()
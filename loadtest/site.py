@@ -0,0 +1,394 @@
+"""Synthetic Easy Apply site for load-testing the applier.
+
+Every job id maps deterministically (per seed) to a job page with a
+multi-step Easy Apply modal. The field mix, label phrasing, radio/select
+structure, number of steps and injected latency all vary per job.
+Submissions are recorded so the runner can check what was filled in.
+
+Serve it on its own with:
+
+    python -m loadtest.site --port 8000
+"""
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Label phrasings per question kind. Some deliberately miss the applier's
+# keyword matching so accuracy reflects real-world label variety.
+TEXT_LABELS = {
+    "years_experience": [
+        "How many years of experience do you have with {skill}?",
+        "How many years of work experience do you have using {skill}?",
+        "Years of experience in {skill}",
+        "Total experience with {skill} (years)",
+    ],
+    "notice_period": [
+        "What is your notice period (in days)?",
+        "Notice period",
+        "When can you start? (days)",
+    ],
+    "notice_period_months": [
+        "What is your notice period in months?",
+    ],
+    "current_salary": [
+        "Current CTC",
+        "What is your current fixed CTC?",
+    ],
+    "salary_expectation": [
+        "What is your expected salary?",
+        "Salary expectation (annual)",
+        "Expected compensation",
+    ],
+    "free_text": [
+        "Describe a project you are proud of",
+        "Anything else you'd like us to know?",
+        "Link to your portfolio",
+    ],
+}
+CHOICE_LABELS = {
+    "work_authorization": [
+        "Are you legally authorized to work in this country?",
+        "Do you have the right to work here?",
+    ],
+    "sponsorship": [
+        "Will you now or in the future require sponsorship for employment visa status?",
+        "Do you need visa sponsorship?",
+    ],
+    "relocate": [
+        "Are you comfortable working onsite?",
+        "Are you willing to relocate?",
+    ],
+    "previously_worked": [
+        "Have you previously worked for this company?",
+    ],
+}
+EDUCATION_LABELS = [
+    "What is your highest level of education?",
+    "Highest degree completed",
+]
+EDUCATION_OPTIONS = ["High School", "Bachelor's Degree", "Master's Degree", "Ph.D."]
+SKILLS = ["Python", "Django", "AWS", "PostgreSQL", "Docker", "Kubernetes", "React"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+
+
+def generate_job(job_id, seed=0, max_latency_ms=0):
+    """Build the deterministic spec for one synthetic job."""
+    rng = random.Random(seed * 1_000_003 + job_id)
+
+    fields = []
+    if rng.random() < 0.8:
+        fields.append(
+            {"kind": "phone", "widget": "phone", "label": "Mobile phone number"}
+        )
+    if rng.random() < 0.6:
+        fields.append({"kind": "email", "widget": "email", "label": "Email address"})
+    if rng.random() < 0.7:
+        fields.append({"kind": "resume", "widget": "file", "label": "Upload resume"})
+
+    for _ in range(rng.randint(1, 8)):
+        roll = rng.random()
+        if roll < 0.5:
+            kind = rng.choice(list(TEXT_LABELS))
+            fields.append(
+                {
+                    "kind": kind,
+                    "widget": "textarea" if kind == "free_text" else "text",
+                    "label": rng.choice(TEXT_LABELS[kind]).format(
+                        skill=rng.choice(SKILLS)
+                    ),
+                    "labelling": rng.choice(["for", "wrap", "aria", "placeholder"]),
+                    "input_type": rng.choice(["text", "number"])
+                    if kind != "free_text"
+                    else "text",
+                }
+            )
+        elif roll < 0.8:
+            kind = rng.choice(list(CHOICE_LABELS))
+            fields.append(
+                {
+                    "kind": kind,
+                    "widget": "radio",
+                    "label": rng.choice(CHOICE_LABELS[kind]),
+                    "container": rng.choice(["fieldset", "radiogroup"]),
+                    # Either plain Yes/No values or opaque ones matched by label
+                    "options": rng.choice(
+                        [[("Yes", "Yes"), ("No", "No")], [("1", "Yes"), ("0", "No")]]
+                    ),
+                }
+            )
+        elif roll < 0.9:
+            kind = rng.choice(list(CHOICE_LABELS))
+            fields.append(
+                {
+                    "kind": kind,
+                    "widget": "select",
+                    "label": rng.choice(CHOICE_LABELS[kind]),
+                    "options": [("Yes", "Yes"), ("No", "No")],
+                }
+            )
+        else:
+            fields.append(
+                {
+                    "kind": "education",
+                    "widget": "select",
+                    "label": rng.choice(EDUCATION_LABELS),
+                    "options": [(o, o) for o in EDUCATION_OPTIONS],
+                }
+            )
+
+    # Spread fields over 1-5 steps, optionally followed by a review screen
+    n_steps = rng.randint(1, 5)
+    steps = [[] for _ in range(n_steps)]
+    for i, field in enumerate(fields):
+        field["id"] = f"f{job_id}_{i}"
+        steps[min(n_steps - 1, int(i * n_steps / len(fields)))].append(field)
+
+    return {
+        "job_id": job_id,
+        "title": f"{rng.choice(SKILLS)} Developer",
+        "company": rng.choice(COMPANIES),
+        "steps": steps,
+        "review": rng.random() < 0.5,
+        "latency_ms": rng.randint(0, max_latency_ms) if max_latency_ms else 0,
+    }
+
+
+def render_field(field):
+    fid = html.escape(field["id"])
+    label = html.escape(field["label"])
+    widget = field["widget"]
+
+    if widget == "phone":
+        body = (
+            f'<label for="{fid}">{label}</label>'
+            f'<input type="tel" id="{fid}" name="phoneNumber">'
+        )
+    elif widget == "email":
+        body = (
+            f'<label for="{fid}">{label}</label>'
+            f'<input type="email" id="{fid}" name="email">'
+        )
+    elif widget == "file":
+        body = (
+            f'<label for="{fid}">{label}</label>'
+            f'<input type="file" id="{fid}" name="resume">'
+        )
+    elif widget in ("text", "textarea"):
+        if widget == "textarea":
+            control = '<textarea id="{id}"{extra}></textarea>'
+        else:
+            control = f'<input type="{field["input_type"]}" id="{{id}}"{{extra}}>'
+        labelling = field.get("labelling", "for")
+        if labelling == "for":
+            body = f'<label for="{fid}">{label}</label>' + control.format(
+                id=fid, extra=""
+            )
+        elif labelling == "wrap":
+            body = f"<label>{label} " + control.format(id=fid, extra="") + "</label>"
+        elif labelling == "aria":
+            body = control.format(id=fid, extra=f' aria-label="{label}"')
+        else:
+            body = control.format(id=fid, extra=f' placeholder="{label}"')
+    elif widget == "radio":
+        options = "".join(
+            f'<input type="radio" id="{fid}_{k}" name="{fid}" value="{html.escape(v)}">'
+            f'<label for="{fid}_{k}">{html.escape(text)}</label>'
+            for k, (v, text) in enumerate(field["options"])
+        )
+        if field["container"] == "fieldset":
+            body = f"<fieldset><legend>{label}</legend>{options}</fieldset>"
+        else:
+            body = f'<div role="radiogroup" aria-label="{label}">{options}</div>'
+    else:
+        options = '<option value="">Select an option</option>' + "".join(
+            f'<option value="{html.escape(v)}">{html.escape(text)}</option>'
+            for v, text in field["options"]
+        )
+        body = (
+            f'<label for="{fid}">{label}</label>'
+            f'<select id="{fid}" name="{fid}">{options}</select>'
+        )
+
+    return f'<div class="fb-field" data-field="{fid}">{body}</div>'
+
+
+def render_job_page(spec, step_latency_ms=0):
+    screens = []
+    for idx, step in enumerate(spec["steps"]):
+        is_last = idx == len(spec["steps"]) - 1
+        if not is_last:
+            button = '<button aria-label="Continue to next step">Next</button>'
+        elif spec["review"]:
+            button = "<button>Review</button>"
+        else:
+            button = "<button>Submit application</button>"
+        screens.append("".join(render_field(f) for f in step) + button)
+    if spec["review"]:
+        screens.append(
+            "<p>Review your application</p><button>Submit application</button>"
+        )
+
+    templates = "".join(
+        f'<template id="step-{i}">{screen}</template>'
+        for i, screen in enumerate(screens)
+    )
+    title = html.escape(spec["title"])
+    return f"""<!doctype html>
+<html><head><title>{title} | Synthetic Jobs</title></head>
+<body>
+<h1>{title}</h1><h2>{html.escape(spec["company"])}</h2>
+<div class="jobs-apply-button--top-card">
+  <button id="jobs-apply-button-id">Easy Apply</button>
+</div>
+<div id="modal-root"></div>
+{templates}
+<script>
+const JOB_ID = {spec["job_id"]};
+const STEP_LATENCY_MS = {step_latency_ms};
+const answers = {{}};
+let step = 0;
+let modal = null;
+let content = null;
+let loading = false;
+
+function collect() {{
+  content.querySelectorAll("[data-field]").forEach((el) => {{
+    const id = el.dataset.field;
+    const checked = el.querySelector("input[type=radio]:checked");
+    const file = el.querySelector("input[type=file]");
+    const control = el.querySelector("input, textarea, select");
+    if (checked) answers[id] = checked.value;
+    else if (file) answers[id] = file.files.length ? file.files[0].name : "";
+    else if (control && control.type !== "radio") answers[id] = control.value;
+    else answers[id] = "";
+  }});
+}}
+
+function render() {{
+  // Like LinkedIn, the previous step stays on screen until the next one is
+  // swapped in; the modal chrome (Dismiss) is never re-rendered
+  const tpl = document.getElementById("step-" + step);
+  content.replaceChildren(tpl.content.cloneNode(true));
+  content.querySelector("button").addEventListener("click", advance);
+  loading = false;
+}}
+
+function advance(event) {{
+  event.preventDefault();
+  if (loading) return;
+  collect();
+  if (event.target.textContent.includes("Submit application")) {{
+    navigator.sendBeacon("/submit/" + JOB_ID, JSON.stringify(answers));
+    content.innerHTML = "<p>Application submitted</p>";
+    return;
+  }}
+  step += 1;
+  loading = true;
+  setTimeout(render, STEP_LATENCY_MS);
+}}
+
+document.getElementById("jobs-apply-button-id").addEventListener("click", () => {{
+  if (modal) return;
+  modal = document.createElement("div");
+  modal.className = "jobs-easy-apply-modal";
+  modal.innerHTML = '<button aria-label="Dismiss">&times;</button>';
+  content = document.createElement("div");
+  modal.appendChild(content);
+  document.getElementById("modal-root").appendChild(modal);
+  render();
+}});
+</script>
+</body></html>"""
+
+
+class SyntheticSite:
+    """Generates job specs on demand and records submissions."""
+
+    def __init__(self, seed=0, max_latency_ms=0, step_latency_ms=0):
+        self.seed = seed
+        self.max_latency_ms = max_latency_ms
+        self.step_latency_ms = step_latency_ms
+        self.submissions = {}
+        self._lock = threading.Lock()
+
+    def spec(self, job_id):
+        return generate_job(job_id, self.seed, self.max_latency_ms)
+
+    def record(self, job_id, answers):
+        with self._lock:
+            self.submissions[job_id] = {"answers": answers, "at": time.time()}
+
+    def handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                match = re.fullmatch(r"/jobs/view/(\d+)/?", self.path)
+                if match:
+                    spec = site.spec(int(match.group(1)))
+                    time.sleep(spec["latency_ms"] / 1000)
+                    return self._send(
+                        render_job_page(spec, site.step_latency_ms), "text/html"
+                    )
+                match = re.fullmatch(r"/spec/(\d+)/?", self.path)
+                if match:
+                    return self._send(
+                        json.dumps(site.spec(int(match.group(1)))), "application/json"
+                    )
+                self.send_error(404)
+
+            def do_POST(self):
+                match = re.fullmatch(r"/submit/(\d+)/?", self.path)
+                if not match:
+                    return self.send_error(404)
+                length = int(self.headers.get("Content-Length", 0))
+                site.record(int(match.group(1)), json.loads(self.rfile.read(length)))
+                self._send("{}", "application/json")
+
+            def _send(self, body, content_type):
+                data = body.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve(self, host="127.0.0.1", port=0):
+        """Start the server on a background thread; return it (see .server_port)."""
+        server = ThreadingHTTPServer((host, port), self.handler())
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-latency-ms", type=int, default=0)
+    parser.add_argument("--step-latency-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    site = SyntheticSite(args.seed, args.max_latency_ms, args.step_latency_ms)
+    server = site.serve(port=args.port)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    print(f"🌐 Serving synthetic jobs at {base_url}/jobs/view/<id>/")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,26 @@ import yaml
 from playwright.sync_api import sync_playwright
 
 from utils.apply import apply_for_jobs
+from utils.daemon import DAEMON_ENABLED, run_daemon
 from utils.humanize import random_sleep
 from utils.login import (
+    SessionExpired,
+    has_valid_session,
     is_logged_in,
     perform_login,
     save_cookies,
     wait_for_page_full_load,
 )
+from utils.ratelimit import acquire
 from utils.search import search_easy_apply_jobs
 
 
+def relogin(browser, page):
+    perform_login(page)
+    wait_for_page_full_load(page)
+    save_cookies(browser)
+
+
 def main():
     with open("config.yaml") as f:
         config = yaml.safe_load(f).get("automation", {})
@@ -23,27 +33,48 @@ def main():
             args=["--start-maximized"],
         )
 
-        print("✅ Using existing session.")
         page = browser.new_page()
-        page.goto("https://www.linkedin.com/feed/")
-        wait_for_page_full_load(page)
-
-        # Random delay for human-like behavior
-        random_sleep()
 
-        # Check login state
-        if not is_logged_in(page):
-            print("🔐 Session expired. Logging in again...")
-            perform_login(page)
-            wait_for_page_full_load(page)
-            save_cookies(browser)
+        if has_valid_session():
+            # Skip the feed round-trip; the search page itself detects a stale session.
+            # The persistent context already holds the cookies from ./user_data.
+            print("✅ Saved session is valid, going straight to the search.")
         else:
-            print("🎉 Logged in successfully using existing session.")
+            print("✅ Using existing session.")
+            acquire("navigation")
+            page.goto("https://www.linkedin.com/feed/")
+            wait_for_page_full_load(page)
 
-        random_sleep()
-        print(f"🌐 Current Page Title: {page.title()}")
+            # Random delay for human-like behavior
+            random_sleep()
 
-        jobs = search_easy_apply_jobs(page)
+            # Check login state
+            if not is_logged_in(page):
+                print("🔐 Session expired. Logging in again...")
+                relogin(browser, page)
+            else:
+                print("🎉 Logged in successfully using existing session.")
+                # Lets the next run take the fast path above
+                save_cookies(browser)
+
+            random_sleep()
+            print(f"🌐 Current Page Title: {page.title()}")
+
+        if DAEMON_ENABLED:
+            print("🤖 Starting daemon mode with a warm browser...")
+            run_daemon(browser, search_page=page)
+            browser.close()
+            return
+
+        try:
+            jobs = search_easy_apply_jobs(page)
+        except SessionExpired:
+            print("🔐 Redirected to login. Logging in again...")
+            relogin(browser, page)
+            jobs = search_easy_apply_jobs(page)
+        else:
+            # Refresh the saved auth cookie expiry for the next offline check
+            save_cookies(browser)
         print(jobs)
 
         print("Applying for jobs")
@@ -0,0 +1,139 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from db.export import export_history
+from db.models import JobApplication, record_application
+
+
+def _app(job_id, company, status, at, **kwargs):
+    return JobApplication(
+        job_id=job_id,
+        title="Python Developer",
+        company=company,
+        applied_at=datetime.fromisoformat(at),
+        status=status,
+        **kwargs,
+    )
+
+
+def _record_legacy(app, path):
+    # Written before answered_questions was part of the record
+    record = asdict(app)
+    record["applied_at"] = app.applied_at.isoformat()
+    del record["answered_questions"]
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+@pytest.fixture
+def exported(tmp_path):
+    history = str(tmp_path / "applications.jsonl")
+    record_application(
+        _app(
+            "1",
+            "Acme",
+            "applied",
+            "2026-10-01T10:15:00",
+            phase_timings={"navigate": 1.0, "fill": 2.0},
+            form_fingerprint="aaa",
+            answered_questions=["Phone"],
+        ),
+        history,
+    )
+    record_application(
+        _app(
+            "2",
+            "Acme",
+            "failed",
+            "2026-10-01T10:40:00",
+            phase_timings={"navigate": 3.0},
+            form_fingerprint="aaa",
+            answered_questions=["Phone"],
+            unanswered_questions=["Visa?"],
+        ),
+        history,
+    )
+    record_application(
+        _app(
+            "3",
+            "Globex",
+            "skipped",
+            "2026-10-01T11:05:00",
+            phase_timings={"navigate": 2.0},
+        ),
+        history,
+    )
+    # One legacy record shares a chunk with a new one, the other is alone
+    _record_legacy(
+        _app(
+            "4",
+            "Globex",
+            "applied",
+            "2026-10-01T10:50:00",
+            unanswered_questions=["Notice?"],
+        ),
+        history,
+    )
+    _record_legacy(
+        _app(
+            "5",
+            "Globex",
+            "applied",
+            "2026-10-01T11:30:00",
+            unanswered_questions=["Relocate?"],
+        ),
+        history,
+    )
+
+    out_dir = tmp_path / "exports"
+    tables = export_history(history, str(out_dir), chunksize=2)
+    return tables, out_dir
+
+
+def test_applications_per_hour(exported):
+    tables, _ = exported
+    per_hour = tables["Applications per hour"]
+    assert per_hour["hour"].dt.hour.tolist() == [10, 11]
+    assert per_hour["applications"].tolist() == [2, 1]
+
+
+def test_phase_percentiles(exported):
+    tables, _ = exported
+    phases = tables["Phase percentiles"].set_index("phase")
+    assert phases.loc["navigate", "samples"] == 3
+    assert phases.loc["navigate", "p50_s"] == 2.0
+    assert phases.loc["fill", "samples"] == 1
+    assert phases.loc["submit", "samples"] == 0
+    assert pd.isna(phases.loc["submit", "p50_s"])
+
+
+def test_success_rate_excludes_skipped_jobs(exported):
+    tables, _ = exported
+    by_company = tables["By company"].set_index("company")
+    assert by_company.loc["Acme", "applications"] == 2
+    assert by_company.loc["Acme", "success_rate"] == 0.5
+    assert by_company.loc["Globex", "applications"] == 2
+    assert by_company.loc["Globex", "skipped"] == 1
+    assert by_company.loc["Globex", "success_rate"] == 1.0
+
+
+def test_questions_split_answered_and_unanswered(exported):
+    _, out_dir = exported
+    questions = pd.read_csv(out_dir / "questions.csv", dtype={"job_id": str})
+    rows = set(
+        questions[["job_id", "question", "answered"]].itertuples(index=False, name=None)
+    )
+    assert rows == {
+        ("1", "Phone", True),
+        ("2", "Phone", True),
+        ("2", "Visa?", False),
+        ("4", "Notice?", False),
+        ("5", "Relocate?", False),
+    }
+
+    applications = pd.read_csv(out_dir / "applications.csv")
+    assert len(applications) == 5
@@ -0,0 +1,58 @@
+import importlib
+import json
+import os
+import shutil
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("playwright")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def login(tmp_path, monkeypatch):
+    # utils.login reads config.yaml from the working directory on import
+    config = os.path.join(REPO_ROOT, "sample-config.yaml")
+    shutil.copy(config, tmp_path / "config.yaml")
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("utils.login")
+
+
+def _write_state(tmp_path, expires):
+    path = tmp_path / "cookies.json"
+    cookie = {"name": "li_at", "domain": ".www.linkedin.com", "expires": expires}
+    path.write_text(json.dumps({"cookies": [cookie], "origins": []}))
+    return str(path)
+
+
+def test_missing_state_file_is_not_a_session(login, tmp_path):
+    assert not login.has_valid_session(str(tmp_path / "missing.json"))
+
+
+def test_expired_auth_cookie_is_not_a_session(login, tmp_path):
+    assert not login.has_valid_session(_write_state(tmp_path, time.time() - 60))
+
+
+def test_session_cookie_counts_as_valid(login, tmp_path):
+    assert login.has_valid_session(_write_state(tmp_path, -1))
+
+
+def test_future_expiry_is_valid(login, tmp_path):
+    assert login.has_valid_session(_write_state(tmp_path, time.time() + 3600))
+
+
+def test_authwall_is_an_auth_redirect(login):
+    page = SimpleNamespace(
+        url="https://www.linkedin.com/authwall?trk=gf&sessionRedirect=%2Fjobs"
+    )
+    assert login.is_auth_redirect(page)
+
+
+def test_login_in_query_is_not_an_auth_redirect(login):
+    page = SimpleNamespace(
+        url="https://www.linkedin.com/jobs/search/?keywords=login%20engineer"
+    )
+    assert not login.is_auth_redirect(page)
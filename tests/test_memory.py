@@ -0,0 +1,88 @@
+import importlib
+import os
+import shutil
+
+import pytest
+
+from utils.handles import HandleScope
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeHandle:
+    def __init__(self, detached=False):
+        self.detached = detached
+        self.disposed = False
+
+    def dispose(self):
+        if self.detached:
+            raise RuntimeError("Target closed")
+        self.disposed = True
+
+
+def test_scope_disposes_tracked_handles_on_exit():
+    single, listed = FakeHandle(), [FakeHandle(), FakeHandle()]
+    with HandleScope() as scope:
+        assert scope.track(single) is single
+        assert scope.track(None) is None
+        assert scope.track_all(listed) is listed
+
+    assert all(h.disposed for h in [single, *listed])
+    assert scope.handles == []
+
+
+def test_scope_disposes_on_error_and_skips_detached_handles():
+    live = FakeHandle()
+    with pytest.raises(ValueError):
+        with HandleScope() as scope:
+            scope.track_all([FakeHandle(detached=True), live])
+            raise ValueError("step failed")
+
+    assert live.disposed
+    assert scope.handles == []
+
+
+@pytest.fixture
+def memory(tmp_path, monkeypatch):
+    # utils.memory reads config.yaml from the working directory on import
+    config = os.path.join(REPO_ROOT, "sample-config.yaml")
+    shutil.copy(config, tmp_path / "config.yaml")
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("utils.memory")
+    monkeypatch.setattr(module, "RECYCLE_RSS_MB", 2048)
+    monkeypatch.setattr(module, "RECYCLE_RSS_GROWTH_MB", 256)
+    monkeypatch.setattr(module, "_rss_baseline_mb", None)
+    return module
+
+
+def test_rss_trigger_waits_for_growth_after_a_recycle(memory, monkeypatch):
+    assert not memory.rss_over_limit(None)
+    assert not memory.rss_over_limit(2000)
+    assert memory.rss_over_limit(2100)
+
+    # The browser-wide total stays high after recycling one page
+    monkeypatch.setattr(memory, "_rss_baseline_mb", 2080)
+    assert not memory.rss_over_limit(2100)
+    assert not memory.rss_over_limit(2300)
+    assert memory.rss_over_limit(2336)
+
+
+def test_recycle_records_the_post_recycle_baseline(memory, monkeypatch):
+    class FakePage:
+        def __init__(self, context):
+            self.context = context
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    class FakeContext:
+        def new_page(self):
+            return FakePage(self)
+
+    old = FakePage(FakeContext())
+    monkeypatch.setattr(memory, "browser_rss_mb", lambda: 2080.0)
+
+    new = memory.recycle_page(old)
+    assert old.closed and new is not old
+    assert memory._rss_baseline_mb == 2080.0
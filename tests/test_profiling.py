@@ -0,0 +1,92 @@
+import importlib
+import json
+import os
+import shutil
+import time
+from types import SimpleNamespace
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeTracing:
+    def __init__(self, fail_start_chunk=False):
+        self.fail_start_chunk = fail_start_chunk
+        self.saved = []
+
+    def start(self, **kwargs):
+        pass
+
+    def start_chunk(self, **kwargs):
+        if self.fail_start_chunk:
+            raise RuntimeError("tracing is not started")
+
+    def stop_chunk(self, path=None):
+        if path:
+            with open(path, "wb") as f:
+                f.write(b"trace")
+            self.saved.append(path)
+
+
+class FakeContext:
+    def __init__(self, **kwargs):
+        self.tracing = FakeTracing(**kwargs)
+
+
+@pytest.fixture
+def profiling(tmp_path, monkeypatch):
+    # utils.profiling reads config.yaml from the working directory on import
+    config = os.path.join(REPO_ROOT, "sample-config.yaml")
+    shutil.copy(config, tmp_path / "config.yaml")
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("utils.profiling")
+    monkeypatch.setattr(module, "PROFILE_DIR", str(tmp_path / "profiles"))
+    monkeypatch.setattr(module, "KEEP_SLOWEST", 2)
+    monkeypatch.setattr(module, "SLOW_JOB_S", 60)
+    return module
+
+
+def _run(profiler, job_id, success, duration, monkeypatch, profiling):
+    clock = iter([0.0, duration])
+    fake_time = SimpleNamespace(
+        perf_counter=lambda: next(clock), strftime=time.strftime
+    )
+    monkeypatch.setattr(profiling, "time", fake_time)
+    with profiler.job({"job_id": job_id, "title": job_id}) as capture:
+        capture.success = success
+
+
+def test_traces_kept_for_failures_slow_jobs_and_slowest(profiling, monkeypatch):
+    context = FakeContext()
+    profiler = profiling.JobProfiler(context)
+
+    # The index has room, so the first two successes rank among the slowest
+    _run(profiler, "a", True, 5.0, monkeypatch, profiling)
+    _run(profiler, "b", True, 6.0, monkeypatch, profiling)
+    # Faster than both indexed jobs: discarded
+    _run(profiler, "c", True, 1.0, monkeypatch, profiling)
+    # Failure: always kept
+    _run(profiler, "d", False, 0.5, monkeypatch, profiling)
+    # Successful but over the slow-job threshold
+    _run(profiler, "e", True, 90.0, monkeypatch, profiling)
+
+    kept = [os.path.basename(p).split("-", 2)[-1] for p in context.tracing.saved]
+    assert kept == ["a.trace.zip", "b.trace.zip", "d.trace.zip", "e.trace.zip"]
+
+    with open(os.path.join(profiling.PROFILE_DIR, profiling.INDEX_FILE)) as f:
+        slowest = json.load(f)["slowest"]
+    assert [e["job_id"] for e in slowest] == ["e", "b"]
+
+
+def test_capture_errors_do_not_escape(profiling, monkeypatch):
+    context = FakeContext(fail_start_chunk=True)
+    profiler = profiling.JobProfiler(context)
+
+    def broken_rotate(protected):
+        raise FileNotFoundError("rotated by another process")
+
+    monkeypatch.setattr(profiler, "_rotate", broken_rotate)
+    _run(profiler, "a", False, 1.0, monkeypatch, profiling)
+
+    assert context.tracing.saved == []
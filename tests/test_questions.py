@@ -0,0 +1,53 @@
+from utils.questions import cluster_questions, normalize_question
+
+
+def test_normalize_strips_punctuation_and_masks_numbers():
+    assert (
+        normalize_question("How many years (5+) of Python?!")
+        == "how many years # of python"
+    )
+    assert normalize_question("Notice  period:\n 2.5 months") == "notice period # months"
+
+
+def test_near_duplicates_merge_at_threshold():
+    questions = {
+        "How many years of experience do you have with Python?": (3, 1),
+        "How many years of experience do you have with Pythons?": (1, 0),
+        "Are you willing to relocate?": (2, 0),
+    }
+
+    clusters = cluster_questions(questions, threshold=90)
+    assert len(clusters) == 2
+    merged = next(c for c in clusters if len(c["variants"]) == 2)
+    assert merged["representative"].endswith("with Python?")
+    assert merged["occurrences"] == 4
+    assert merged["failed_applications"] == 1
+
+    # The same pair stays apart when the threshold demands an exact match
+    assert len(cluster_questions(questions, threshold=100)) == 3
+
+
+def test_labels_with_identical_normalization_always_merge():
+    questions = {"Years of experience: 3": (1, 0), "years of experience (5)": (1, 0)}
+    clusters = cluster_questions(questions, threshold=100)
+    assert len(clusters) == 1
+    assert sorted(clusters[0]["variants"]) == sorted(questions)
+
+
+def test_clusters_rank_by_failed_applications_then_occurrences():
+    questions = {
+        "What is your current CTC?": (50, 1),
+        "Are you willing to relocate?": (5, 4),
+        "Do you need visa sponsorship?": (10, 4),
+    }
+
+    ranked = [c["representative"] for c in cluster_questions(questions)]
+    assert ranked == [
+        "Do you need visa sponsorship?",
+        "Are you willing to relocate?",
+        "What is your current CTC?",
+    ]
+
+
+def test_empty_input():
+    assert cluster_questions({}) == []
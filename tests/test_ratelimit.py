@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each worker takes two tokens and reports when each acquire returned
+WORKER = """
+import json, time
+from utils.ratelimit import acquire
+out = []
+for _ in range(2):
+    delay = acquire("submit")
+    out.append({"done": time.time(), "delay": delay})
+print(json.dumps(out))
+"""
+
+
+def _write_config(tmp_path, bucket):
+    config = {
+        "rate_limits": {
+            "db_path": str(tmp_path / "ratelimit.db"),
+            "buckets": {"submit": bucket},
+        }
+    }
+    (tmp_path / "config.yaml").write_text(yaml.safe_dump(config))
+
+
+def _spawn(tmp_path, code):
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT}
+    return subprocess.Popen(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def test_bucket_is_shared_across_processes(tmp_path):
+    # One token every 2s with a burst of 2: four acquisitions need ~4s
+    _write_config(tmp_path, {"per_minute": 30, "burst": 2})
+
+    start = time.time()
+    workers = [_spawn(tmp_path, WORKER) for _ in range(2)]
+    results = []
+    for worker in workers:
+        stdout, stderr = worker.communicate(timeout=60)
+        assert worker.returncode == 0, stderr
+        results.extend(json.loads(stdout.strip().splitlines()[-1]))
+
+    delays = sorted(r["delay"] for r in results)
+    done = sorted(r["done"] - start for r in results)
+
+    # The burst is served immediately, the rest waits for refills
+    assert delays[:2] == [0.0, 0.0]
+    assert all(d > 0 for d in delays[2:])
+    # Third and fourth tokens arrive one refill interval apart
+    assert done[3] - done[2] >= 1.9
+    assert done[3] - done[0] >= 3.8
+
+
+def test_zero_rate_is_rejected_at_load_time(tmp_path):
+    _write_config(tmp_path, {"per_minute": 0, "burst": 1})
+
+    worker = _spawn(tmp_path, "import utils.ratelimit")
+    _, stderr = worker.communicate(timeout=60)
+    assert worker.returncode != 0
+    assert "per_minute must be a positive number" in stderr
@@ -1,10 +1,19 @@
+import hashlib
 import json
 import os
+import time
+from collections import Counter
+from datetime import datetime
 
 import yaml
 from dotenv import load_dotenv
 
+from db.models import JobApplication, record_application
+from utils.handles import HandleScope
 from utils.humanize import random_sleep, wait_for_page_full_load
+from utils.memory import recycle_page, should_recycle
+from utils.profiling import get_profiler
+from utils.ratelimit import acquire, print_limiter_metrics
 
 load_dotenv()
 
@@ -31,6 +40,49 @@ CERTIFICATIONS = config.get("certifications", "None")
 
 answered_questions: set[str] = set()
 unanswered_questions: set[str] = set()
+# Per-label counts since the last save: applications the question appeared in,
+# and how many of those applications failed
+unanswered_counts: Counter = Counter()
+failed_counts: Counter = Counter()
+
+
+class JobRun:
+    """Per-job stats: phase timings, form fields seen and question outcomes."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+        self.fields: list[str] = []
+        self.answered: set[str] = set()
+        self.unanswered: set[str] = set()
+        self.steps = 0
+        # Set when the job had no Easy Apply form to fill
+        self.skipped = False
+        self._mark = time.perf_counter()
+
+    def lap(self, phase):
+        """Add the time since the previous lap to `phase`."""
+        now = time.perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+    def fingerprint(self):
+        """Stable id for the form structure (field kinds and labels per step)."""
+        if not self.fields:
+            return None
+        return hashlib.sha1("\n".join(self.fields).encode()).hexdigest()[:12]
+
+
+current_job = JobRun()
+
+
+def mark_answered(label_text):
+    answered_questions.add(label_text)
+    current_job.answered.add(label_text)
+
+
+def mark_unanswered(label_text):
+    unanswered_questions.add(label_text)
+    current_job.unanswered.add(label_text)
 
 
 def save_questions_data():
@@ -54,6 +106,12 @@ def save_questions_data():
             set(existing_data.get("unanswered_questions", []))
             | set(data["unanswered_questions"])
         )
+        existing_data["unanswered_counts"] = dict(
+            Counter(existing_data.get("unanswered_counts", {})) + unanswered_counts
+        )
+        existing_data["failed_counts"] = dict(
+            Counter(existing_data.get("failed_counts", {})) + failed_counts
+        )
 
         # Save updated data
         with open(questions_file, "w") as f:
@@ -61,47 +119,113 @@ def save_questions_data():
 
     else:
         # Create new file
+        data["unanswered_counts"] = dict(unanswered_counts)
+        data["failed_counts"] = dict(failed_counts)
         with open(questions_file, "w") as f:
             json.dump(data, f, indent=4)
 
+    # Counts are deltas; clear them so repeated saves don't double count
+    unanswered_counts.clear()
+    failed_counts.clear()
+
 
 def apply_for_jobs(page, jobs, limit=config.get("max_jobs", 10)):
     total = min(len(jobs), limit)
     print(f"➡️ Starting to apply to {total} jobs (out of {len(jobs)})")
 
     applied_count = 0
+    jobs_on_page = 0
     for idx, job in enumerate(jobs[:limit], start=1):
-        title = job.get("title", "Unknown")
-        company = job.get("company", "Unknown")
-        print(f"[{idx}/{total}] Applying to: {title} at {company}")
+        if apply_to_job(page, job, idx, total):
+            applied_count += 1
+
+        jobs_on_page += 1
+        if should_recycle(page, jobs_on_page):
+            page = recycle_page(page)
+            jobs_on_page = 0
+
+    print(f"➡️ Done. Applied to {applied_count}/{total} jobs.")
+    print_limiter_metrics()
+
+    save_questions_data()
+    return applied_count
+
+
+def apply_to_job(page, job, idx, total):
+    """Apply to a single job with progress logging. Never raises."""
+    title = job.get("title", "Unknown")
+    company = job.get("company", "Unknown")
+    print(f"[{idx}/{total}] Applying to: {title} at {company}")
 
+    global current_job
+    success = False
+    current_job = JobRun()
+    with get_profiler(page.context).job(job) as capture:
         try:
             success = apply_easy_apply_job(page, job)
-            print(f"[{idx}/{total}] {'✅ Applied' if success else '❌ Skipped/Failed'}")
-            if success:
-                applied_count += 1
+            print(
+                f"[{idx}/{total}] {'✅ Applied' if success else '❌ Skipped/Failed'}"
+            )
         except Exception as e:
             print(f"[{idx}/{total}] Exception while applying: {e}")
+        capture.success = success
 
-        random_sleep()
+    unanswered_counts.update(current_job.unanswered)
+    if not success:
+        failed_counts.update(current_job.unanswered)
 
-    print(f"➡️ Done. Applied to {applied_count}/{total} jobs.")
+    try:
+        record_application(
+            JobApplication(
+                job_id=str(job.get("job_id") or job.get("link", "")),
+                title=title,
+                company=company,
+                applied_at=datetime.now(),
+                status=_status(success),
+                phase_timings={
+                    k: round(v, 3) for k, v in current_job.timings.items()
+                },
+                form_fingerprint=current_job.fingerprint(),
+                steps=current_job.steps,
+                questions_answered=len(current_job.answered),
+                answered_questions=sorted(current_job.answered),
+                unanswered_questions=sorted(current_job.unanswered),
+            )
+        )
+    except Exception as e:
+        print(f"⚠️ Could not record application: {e}")
+
+    random_sleep()
+    return success
 
-    save_questions_data()
-    return applied_count
+
+def _status(success):
+    if success:
+        return "applied"
+    return "skipped" if current_job.skipped else "failed"
 
 
 def apply_easy_apply_job(page, job):
+    acquire("navigation")
+    current_job.lap("rate_limit_wait")
     page.goto(job["link"])
     wait_for_page_full_load(page)
     random_sleep()
+    current_job.lap("navigate")
+
+    # Handles that live for the whole application (button, modal)
+    with HandleScope() as scope:
+        return _fill_easy_apply_form(page, job, scope)
+
 
+def _fill_easy_apply_form(page, job, scope):
     try:
-        easy_apply_btn = page.query_selector(
-            ".jobs-apply-button--top-card #jobs-apply-button-id"
+        easy_apply_btn = scope.track(
+            page.query_selector(".jobs-apply-button--top-card #jobs-apply-button-id")
         )
         if not easy_apply_btn:
             print("❌ Easy Apply not available, skipping.")
+            current_job.skipped = True
             return False
 
         if easy_apply_btn:
@@ -114,147 +238,181 @@ def apply_easy_apply_job(page, job):
 
         # Wait for form modal to appear
         try:
-            form_modal = page.wait_for_selector(
-                "div.jobs-easy-apply-modal", timeout=7000
+            form_modal = scope.track(
+                page.wait_for_selector("div.jobs-easy-apply-modal", timeout=7000)
             )
         except Exception:
             print("⚠️ Form modal not found.")
+            current_job.skipped = True
             return False
+        current_job.lap("open_modal")
 
         # Multi-step application handling
         max_steps = 10
         step_count = 0
 
         while step_count < max_steps:
-            step_count += 1
-            print(f"Processing step {step_count}...")
-
-            # Fill phone if present
-            phone_selectors = [
-                "input[name*='phone']",
-                "input[id*='phone']",
-                "input[id*='phoneNumber']",
-                "input[inputmode='tel']",
-                "input[type='tel']",
-                "input[aria-label*='phone']",
-                "input[placeholder*='phone']",
-                "input[inputmode='text'][id*='phone']",
-            ]
-
-            phone_input = None
-            phone_input_selector = None
-            for sel in phone_selectors:
-                phone_input = form_modal.query_selector(sel)
-                if phone_input:
-                    phone_input_selector = sel
-                    break
-
-            random_sleep()
-
-            if phone_input_selector and phone_input and PHONE:
-                try:
-                    phone_input.fill(PHONE)
-                except Exception:
-                    pass
-
-            # Fill email if present
-            email_input = form_modal.query_selector("input[name*='email']")
-            if email_input:
-                email_input.fill(EMAIL)
-
-            # Handle file upload
-            file_input = form_modal.query_selector("input[type='file']")
-            if file_input:
-                file_input.set_input_files(RESUME_PATH)
-
-            # Handle text inputs and textareas (for experience, notice period, etc.)
-            text_inputs = form_modal.query_selector_all(
-                "input[type='text'], input[type='number'], textarea"
-            )
-            for inp in text_inputs:
-                try:
-                    label_text = get_label_for_input(page, inp)
-                    answer = get_answer_for_question(label_text)
-                    if answer and inp.is_visible():
-                        answered_questions.add(label_text)
-                        inp.fill(str(answer))
-                        print(f"  Filled: {label_text} ... with: {answer}")
-                    else:
-                        unanswered_questions.add(label_text)
-                except Exception as e:
-                    print(f"  Error filling input: {e}")
+            # Handles created during this step are disposed when it ends
+            with HandleScope() as step:
+                step_count += 1
+                current_job.steps = step_count
+                print(f"Processing step {step_count}...")
+
+                # Fill phone if present
+                phone_selectors = [
+                    "input[name*='phone']",
+                    "input[id*='phone']",
+                    "input[id*='phoneNumber']",
+                    "input[inputmode='tel']",
+                    "input[type='tel']",
+                    "input[aria-label*='phone']",
+                    "input[placeholder*='phone']",
+                    "input[inputmode='text'][id*='phone']",
+                ]
+
+                phone_input = None
+                phone_input_selector = None
+                for sel in phone_selectors:
+                    phone_input = step.track(form_modal.query_selector(sel))
+                    if phone_input:
+                        phone_input_selector = sel
+                        break
 
-            random_sleep()
+                random_sleep()
 
-            # Handle radio buttons
-            radio_groups = form_modal.query_selector_all(
-                "fieldset, div[role='radiogroup']"
-            )
-            for group in radio_groups:
-                try:
-                    label_text = get_label_for_input(page, group)
-                    answers = ["Yes", "True"]
-                    for answer in answers:
-                        if select_radio_option(group, answer):
-                            print(f"  Selected radio: {label_text}... with: {answer}")
-                            break
-                    else:
-                        unanswered_questions.add(label_text)
-                except Exception as e:
-                    print(f"  Error handling radio group: {e}")
-
-            random_sleep()
-
-            # Handle dropdowns/select elements
-            selects = form_modal.query_selector_all("select")
-            for sel in selects:
-                try:
-                    label_text = get_label_for_input(page, sel)
-                    answers = ["Yes", "True"]
-                    for answer in answers:
-                        if select_dropdown_option(sel, answer):
-                            print(
-                                f"  Selected dropdown: {label_text}... with: {answer}"
-                            )
-                            break
-                    else:
-                        unanswered_questions.add(label_text)
-                except Exception as e:
-                    print(f"  Error handling dropdown: {e}")
+                if phone_input_selector and phone_input and PHONE:
+                    try:
+                        phone_input.fill(PHONE)
+                    except Exception:
+                        pass
+
+                # Fill email if present
+                email_input = step.track(
+                    form_modal.query_selector("input[name*='email']")
+                )
+                if email_input:
+                    email_input.fill(EMAIL)
+
+                # Handle file upload
+                file_input = step.track(
+                    form_modal.query_selector("input[type='file']")
+                )
+                if file_input:
+                    file_input.set_input_files(RESUME_PATH)
+
+                # Handle text inputs and textareas (for experience, notice period, etc.)
+                text_inputs = step.track_all(
+                    form_modal.query_selector_all(
+                        "input[type='text'], input[type='number'], textarea"
+                    )
+                )
+                for inp in text_inputs:
+                    try:
+                        label_text = get_label_for_input(page, inp)
+                        current_job.fields.append(f"{step_count}:text:{label_text}")
+                        answer = get_answer_for_question(label_text)
+                        if answer and inp.is_visible():
+                            mark_answered(label_text)
+                            inp.fill(str(answer))
+                            print(f"  Filled: {label_text} ... with: {answer}")
+                        else:
+                            mark_unanswered(label_text)
+                    except Exception as e:
+                        print(f"  Error filling input: {e}")
 
-            random_sleep()
+                random_sleep()
+
+                # Handle radio buttons
+                radio_groups = step.track_all(
+                    form_modal.query_selector_all("fieldset, div[role='radiogroup']")
+                )
+                for group in radio_groups:
+                    try:
+                        label_text = get_label_for_input(page, group)
+                        current_job.fields.append(f"{step_count}:radio:{label_text}")
+                        answers = ["Yes", "True"]
+                        for answer in answers:
+                            if select_radio_option(group, answer):
+                                mark_answered(label_text)
+                                print(
+                                    f"  Selected radio: {label_text}... with: {answer}"
+                                )
+                                break
+                        else:
+                            mark_unanswered(label_text)
+                    except Exception as e:
+                        print(f"  Error handling radio group: {e}")
 
-            # Detect submit button
-            submit_btn = form_modal.query_selector(
-                "button:has-text('Submit application')"
-            )
-            if submit_btn and submit_btn.is_visible():
-                submit_btn.click()
-                print(f"✅ Applied successfully to {job['title']}")
                 random_sleep()
-                return True
-            else:
-                # Check for review button
-                review_btn = form_modal.query_selector("button:has-text('Review')")
-                if review_btn and review_btn.is_visible():
-                    review_btn.click()
+
+                # Handle dropdowns/select elements
+                selects = step.track_all(form_modal.query_selector_all("select"))
+                for sel in selects:
+                    try:
+                        label_text = get_label_for_input(page, sel)
+                        current_job.fields.append(f"{step_count}:select:{label_text}")
+                        answers = ["Yes", "True"]
+                        for answer in answers:
+                            if select_dropdown_option(sel, answer):
+                                mark_answered(label_text)
+                                print(
+                                    f"  Selected dropdown: {label_text}... with: {answer}"
+                                )
+                                break
+                        else:
+                            mark_unanswered(label_text)
+                    except Exception as e:
+                        print(f"  Error handling dropdown: {e}")
+
+                random_sleep()
+                current_job.lap("fill")
+
+                # Detect submit button
+                submit_btn = step.track(
+                    form_modal.query_selector("button:has-text('Submit application')")
+                )
+                if submit_btn and submit_btn.is_visible():
+                    current_job.lap("advance")
+                    acquire("submit")
+                    current_job.lap("rate_limit_wait")
+                    submit_btn.click()
+                    print(f"✅ Applied successfully to {job['title']}")
                     random_sleep()
+                    current_job.lap("submit")
+                    return True
                 else:
-                    print("⚠️ Multi-step application")
-
-                    # Check for "Next" button to continue multi-step form
-                    next_btn = form_modal.query_selector(
-                        "button:has-text('Next'), button[aria-label='Continue to next step']"
+                    # Check for review button
+                    review_btn = step.track(
+                        form_modal.query_selector("button:has-text('Review')")
                     )
-                    if next_btn and next_btn.is_visible():
-                        next_btn.click()
-                        print("Clicked Next button")
+                    if review_btn and review_btn.is_visible():
+                        marker = _step_marker(form_modal, step)
+                        review_btn.click()
                         random_sleep()
+                        _wait_for_step_change(marker)
+                        current_job.lap("advance")
                     else:
-                        # No next button found, might be done or stuck
-                        print("⚠️ No Next or Submit button found")
-                        random_sleep()
-                        break
+                        print("⚠️ Multi-step application")
+
+                        # Check for "Next" button to continue multi-step form
+                        next_btn = step.track(
+                            form_modal.query_selector(
+                                "button:has-text('Next'), button[aria-label='Continue to next step']"
+                            )
+                        )
+                        if next_btn and next_btn.is_visible():
+                            marker = _step_marker(form_modal, step)
+                            next_btn.click()
+                            print("Clicked Next button")
+                            random_sleep()
+                            _wait_for_step_change(marker)
+                            current_job.lap("advance")
+                        else:
+                            # No next button found, might be done or stuck
+                            print("⚠️ No Next or Submit button found")
+                            random_sleep()
+                            current_job.lap("advance")
+                            break
 
         print("⚠️ Max steps reached or unable to complete application")
         return False
@@ -264,42 +422,69 @@ def apply_easy_apply_job(page, job):
         return False
 
 
+def _step_marker(form_modal, scope):
+    """Return a visible form control of the current step, if it has one."""
+    return scope.track(
+        form_modal.query_selector("input:visible, textarea:visible, select:visible")
+    )
+
+
+def _wait_for_step_change(marker):
+    """
+    Wait until `marker` is replaced by the next step's content. The modal's
+    own buttons (Dismiss, Back) stay visible across steps, so they can't
+    tell whether the step has changed.
+    """
+    if not marker:
+        return
+    try:
+        # A detached element counts as hidden
+        marker.wait_for_element_state("hidden", timeout=7000)
+    except Exception:
+        print("⚠️ Next step did not load in time")
+
+
 def get_label_for_input(page, element):
     """Extract label text for an input element"""
     try:
-        # Try to find associated label
-        elem_id = element.get_attribute("id")
-        if elem_id:
-            label = page.query_selector(f"label[for='{elem_id}']")
-            if label:
-                return label.inner_text().strip()
-
-        # Try parent label
-        parent = element.evaluate("el => el.closest('label')")
-        if parent:
-            return element.evaluate("el => el.closest('label').innerText").strip()
-
-        # Try aria-label
-        aria_label = element.get_attribute("aria-label")
-        if aria_label:
-            return aria_label.strip()
-
-        # Try placeholder
-        placeholder = element.get_attribute("placeholder")
-        if placeholder:
-            return placeholder.strip()
-
-        # Try fieldset legend (for radio groups)
-        legend = element.query_selector("legend")
-        if legend:
-            return legend.inner_text().strip()
-
-        return ""
+        with HandleScope() as scope:
+            return _find_label_text(page, element, scope)
     except Exception as e:
         print(f"⚠️ Error getting label for input: {e}")
         return ""
 
 
+def _find_label_text(page, element, scope):
+    # Try to find associated label
+    elem_id = element.get_attribute("id")
+    if elem_id:
+        label = scope.track(page.query_selector(f"label[for='{elem_id}']"))
+        if label:
+            return label.inner_text().strip()
+
+    # Try parent label
+    parent_text = element.evaluate("el => el.closest('label')?.innerText || ''")
+    if parent_text:
+        return parent_text.strip()
+
+    # Try aria-label
+    aria_label = element.get_attribute("aria-label")
+    if aria_label:
+        return aria_label.strip()
+
+    # Try placeholder
+    placeholder = element.get_attribute("placeholder")
+    if placeholder:
+        return placeholder.strip()
+
+    # Try fieldset legend (for radio groups)
+    legend = scope.track(element.query_selector("legend"))
+    if legend:
+        return legend.inner_text().strip()
+
+    return ""
+
+
 def get_answer_for_question(question_text):
     """Match question text to appropriate answer"""
     if not question_text:
@@ -414,47 +599,54 @@ def get_answer_for_question(question_text):
 def select_radio_option(group_element, answer):
     """Select appropriate radio button based on answer"""
     try:
-        answer_lower = str(answer).lower()
-
-        # Map answers to common radio button patterns
-        if answer_lower in ["yes", "true"]:
-            radio = group_element.query_selector(
-                "input[type='radio'][value='Yes'], input[type='radio'][value='yes'], input[type='radio'][value='true']"
-            )
-            if radio and radio.is_visible():
-                try:
-                    radio.click()
-                except Exception:
-                    radio.click(force=True)
-                return True
-
-        if answer_lower in ["no", "false"]:
-            radio = group_element.query_selector(
-                "input[type='radio'][value='No'], input[type='radio'][value='no'], input[type='radio'][value='false']"
-            )
-            if radio and radio.is_visible():
-                try:
-                    radio.click()
-                except Exception:
-                    radio.click(force=True)
-                return True
-
-        # Try to find radio with matching label
-        labels = group_element.query_selector_all("label")
-        for label in labels:
-            if answer_lower in label.inner_text().lower():
-                radio_id = label.get_attribute("for")
-                if radio_id:
-                    radio = group_element.query_selector(
-                        f"input[type='radio']#{radio_id}"
+        with HandleScope() as scope:
+            answer_lower = str(answer).lower()
+
+            # Map answers to common radio button patterns
+            if answer_lower in ["yes", "true"]:
+                radio = scope.track(
+                    group_element.query_selector(
+                        "input[type='radio'][value='Yes'], input[type='radio'][value='yes'], input[type='radio'][value='true']"
                     )
-                    if radio and radio.is_visible():
-                        try:
-                            radio.click()
-                        except Exception:
-                            radio.click(force=True)
-                        return True
-        return False
+                )
+                if radio and radio.is_visible():
+                    try:
+                        radio.click()
+                    except Exception:
+                        radio.click(force=True)
+                    return True
+
+            if answer_lower in ["no", "false"]:
+                radio = scope.track(
+                    group_element.query_selector(
+                        "input[type='radio'][value='No'], input[type='radio'][value='no'], input[type='radio'][value='false']"
+                    )
+                )
+                if radio and radio.is_visible():
+                    try:
+                        radio.click()
+                    except Exception:
+                        radio.click(force=True)
+                    return True
+
+            # Try to find radio with matching label
+            labels = scope.track_all(group_element.query_selector_all("label"))
+            for label in labels:
+                if answer_lower in label.inner_text().lower():
+                    radio_id = label.get_attribute("for")
+                    if radio_id:
+                        radio = scope.track(
+                            group_element.query_selector(
+                                f"input[type='radio']#{radio_id}"
+                            )
+                        )
+                        if radio and radio.is_visible():
+                            try:
+                                radio.click()
+                            except Exception:
+                                radio.click(force=True)
+                            return True
+            return False
     except Exception as e:
         print(f"Error selecting radio: {e}")
 
@@ -463,14 +655,17 @@ def select_dropdown_option(select_element, answer):
     """Select appropriate dropdown option based on answer"""
     try:
         answer_str = str(answer)
-        options = select_element.query_selector_all("option")
+        # Read all options in one call instead of holding a handle per option
+        options = select_element.evaluate(
+            "el => Array.from(el.options).map(o => ({text: o.innerText, value: o.value}))"
+        )
         for option in options:
-            option_text = option.inner_text().strip()
+            option_text = option["text"].strip()
             if (
                 answer_str.lower() in option_text.lower()
                 or option_text.lower() in answer_str.lower()
             ):
-                select_element.select_option(value=option.get_attribute("value"))
+                select_element.select_option(value=option["value"])
                 return True
         return False
     except Exception as e:
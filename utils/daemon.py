@@ -0,0 +1,106 @@
+"""Long-running daemon mode.
+
+Keeps the browser context warm and re-polls the configured search on a
+schedule, applying to jobs as soon as they show up in the list.
+"""
+import time
+from collections import deque
+
+import yaml
+
+from utils.apply import apply_to_job, save_questions_data
+from utils.login import SessionExpired, perform_login, save_cookies
+from utils.memory import RECYCLE_HEAP_MB, page_heap_mb, recycle_page, should_recycle
+from utils.ratelimit import print_limiter_metrics
+from utils.search import iter_easy_apply_jobs
+
+with open("config.yaml") as f:
+    _config = yaml.safe_load(f)
+    config = _config.get("daemon") or {}
+    max_jobs = (_config.get("job_search") or {}).get("max_jobs", 10)
+
+DAEMON_ENABLED = config.get("enabled", False)
+POLL_INTERVAL = config.get("poll_interval", 300)
+SCROLL_TIMES = config.get("scroll_times", 3)
+MAX_JOBS_PER_POLL = config.get("max_jobs_per_poll", max_jobs)
+
+
+def run_daemon(context, search_page=None):
+    """
+    Poll the configured search forever, applying to new jobs as they appear.
+    Searching and applying use separate tabs so the results list keeps its
+    scroll position while a job is being applied to.
+    """
+    search_page = search_page or context.new_page()
+    apply_page = context.new_page()
+
+    seen_ids: set[str] = set()
+    backlog = deque()
+    jobs_since_recycle = 0
+    poll = 0
+    retried_after_login = False
+
+    try:
+        while True:
+            poll += 1
+            print(f"🔁 Poll #{poll}: checking for new jobs")
+            applied = 0
+            attempted = 0
+            relogged_in = False
+
+            def process(job):
+                nonlocal applied, attempted, jobs_since_recycle, apply_page
+                attempted += 1
+                if apply_to_job(apply_page, job, attempted, MAX_JOBS_PER_POLL):
+                    applied += 1
+                jobs_since_recycle += 1
+
+                if should_recycle(apply_page, jobs_since_recycle):
+                    apply_page = recycle_page(apply_page)
+                    jobs_since_recycle = 0
+
+            # Jobs found but not processed in the previous poll go first
+            while backlog and attempted < MAX_JOBS_PER_POLL:
+                process(backlog.popleft())
+
+            try:
+                for job in iter_easy_apply_jobs(search_page, SCROLL_TIMES, seen_ids):
+                    if attempted < MAX_JOBS_PER_POLL:
+                        process(job)
+                    else:
+                        backlog.append(job)
+            except SessionExpired:
+                # Jobs seen before the redirect were already processed
+                print("🔐 Redirected to login. Logging in again...")
+                try:
+                    perform_login(search_page)
+                    save_cookies(context)
+                    relogged_in = True
+                except Exception as e:
+                    print(f"⚠️ Login failed during poll #{poll}: {e}")
+            except Exception as e:
+                print(f"⚠️ Error during poll #{poll}: {e}")
+
+            save_questions_data()
+            print(
+                f"➡️ Poll #{poll} done. Applied to {applied}/{attempted} jobs, "
+                f"{len(backlog)} queued, {len(seen_ids)} seen so far."
+            )
+            print_limiter_metrics()
+
+            if page_heap_mb(search_page) >= RECYCLE_HEAP_MB:
+                search_page = recycle_page(search_page)
+
+            # Re-run the interrupted search right away, but only once in a row so
+            # a login that keeps bouncing back can't spin without sleeping
+            if relogged_in and not retried_after_login:
+                retried_after_login = True
+                print("🔁 Logged in again, polling right away...")
+                continue
+            retried_after_login = False
+
+            print(f"😴 Sleeping {POLL_INTERVAL}s until the next poll...")
+            time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        print("🛑 Daemon stopped.")
+        save_questions_data()
@@ -0,0 +1,40 @@
+"""Scoped ElementHandle lifecycle.
+
+Every ElementHandle pins a remote object in the driver and the renderer
+until it is disposed. Wrap hot paths in a `HandleScope` so the handles
+they create are released when the step finishes.
+"""
+
+
+class HandleScope:
+    """Collects ElementHandles and disposes all of them on exit."""
+
+    def __init__(self):
+        self.handles = []
+
+    def track(self, handle):
+        """Track a single handle (None is passed through) and return it."""
+        if handle is not None:
+            self.handles.append(handle)
+        return handle
+
+    def track_all(self, handles):
+        """Track a list of handles and return it."""
+        self.handles.extend(handles)
+        return handles
+
+    def dispose(self):
+        while self.handles:
+            handle = self.handles.pop()
+            try:
+                handle.dispose()
+            except Exception:
+                # Already detached (navigation, page closed); nothing to free
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.dispose()
+        return False
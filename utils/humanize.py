@@ -87,6 +87,8 @@ def wait_for_page_full_load(page, selector=None, timeout=45000):
             print(f"⚠️ Selector {selector} not found within {timeout} ms.")
 
     # Add a realistic random pause
-    extra_delay = random.uniform(2.5, 5.0)
+    extra_delay = random.uniform(
+        config.get("settle_delay_min", 2.5), config.get("settle_delay_max", 5.0)
+    )
     print(f"🕐 Waiting an extra {extra_delay:.2f}s for async UI rendering...")
     time.sleep(extra_delay)
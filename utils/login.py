@@ -1,4 +1,7 @@
+import json
 import os
+import time
+from urllib.parse import urlparse
 
 import yaml
 from dotenv import load_dotenv
@@ -10,6 +13,7 @@ from utils.humanize import (
     random_sleep,
     wait_for_page_full_load,
 )
+from utils.ratelimit import acquire
 
 load_dotenv()
 
@@ -17,6 +21,11 @@ load_dotenv()
 LINKEDIN_EMAIL: str = os.getenv("LINKEDIN_EMAIL", "")
 LINKEDIN_PASSWORD: str = os.getenv("LINKEDIN_PASSWORD", "")
 
+COOKIES_PATH = "./user_data/cookies.json"
+# LinkedIn's long-lived session cookie; without it every page redirects to login
+AUTH_COOKIE = "li_at"
+AUTH_REDIRECT_PATHS = ("/login", "/authwall", "/checkpoint", "/uas/login")
+
 
 with open("config.yaml") as f:
     config = yaml.safe_load(f)
@@ -31,6 +40,7 @@ def linkedin_login(p):
     context = browser.new_context()
 
     page = context.new_page()
+    acquire("navigation")
     page.goto("https://www.linkedin.com/login", wait_until="load")
     wait_for_page_full_load(page)
 
@@ -59,6 +69,7 @@ def is_logged_in(page: Page) -> bool:
 
 def perform_login(page: Page):
     """Perform LinkedIn login manually."""
+    acquire("navigation")
     page.goto("https://www.linkedin.com/login")
     wait_for_page_full_load(page)
 
@@ -74,15 +85,48 @@ def perform_login(page: Page):
 
 
 def save_cookies(browser_context):
-    path = "./user_data/cookies.json"
+    path = COOKIES_PATH
     _ = browser_context.storage_state(path=path)
     print(f"💾 Cookies saved to {path}")
 
 
 def load_cookies(browser_context):
-    path = "./user_data/cookies.json"
+    path = COOKIES_PATH
     try:
-        browser_context.add_cookies(path)
+        with open(path) as f:
+            state = json.load(f)
+        browser_context.add_cookies(state.get("cookies", []))
         print(f"🍪 Loaded cookies from {path}")
     except Exception:
         print("⚠️ No cookies found or invalid file.")
+
+
+class SessionExpired(Exception):
+    """Raised when LinkedIn redirects a navigation to the login wall."""
+
+
+def has_valid_session(path=COOKIES_PATH) -> bool:
+    """
+    Check the saved storage state offline: the session is considered valid if
+    the auth cookie is present and not expired. Session cookies (expires == -1)
+    count as valid; a stale one is caught later by `is_auth_redirect`.
+    """
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except Exception:
+        return False
+
+    for cookie in state.get("cookies", []):
+        if cookie.get("name") == AUTH_COOKIE and "linkedin.com" in cookie.get(
+            "domain", ""
+        ):
+            expires = cookie.get("expires", -1)
+            return expires == -1 or expires > time.time()
+    return False
+
+
+def is_auth_redirect(page: Page) -> bool:
+    """Detect if the last navigation ended up on a login/authwall page."""
+    path = urlparse(page.url).path
+    return any(path.startswith(p) for p in AUTH_REDIRECT_PATHS)
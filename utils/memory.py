@@ -0,0 +1,108 @@
+"""Memory telemetry and page recycling for long sessions."""
+import os
+
+import yaml
+
+with open("config.yaml") as f:
+    config = yaml.safe_load(f).get("memory") or {}
+
+RECYCLE_AFTER_JOBS = config.get("recycle_after_jobs", 50)
+RECYCLE_HEAP_MB = config.get("recycle_heap_mb", 512)
+RECYCLE_RSS_MB = config.get("recycle_rss_mb", 2048)
+# After a recycle, RSS must grow this much again before it triggers another one
+RECYCLE_RSS_GROWTH_MB = config.get("recycle_rss_growth_mb", 256)
+
+# Driver+browser RSS measured right after the last recycle
+_rss_baseline_mb = None
+
+
+def page_heap_mb(page) -> float:
+    """Return the renderer's JS heap in use for `page` in MB (0 if unavailable)."""
+    try:
+        session = page.context.new_cdp_session(page)
+        try:
+            session.send("Performance.enable")
+            metrics = session.send("Performance.getMetrics")["metrics"]
+        finally:
+            session.detach()
+    except Exception:
+        return 0.0
+    used = next((m["value"] for m in metrics if m["name"] == "JSHeapUsedSize"), 0)
+    return used / (1024 * 1024)
+
+
+def browser_rss_mb():
+    """
+    Return the summed RSS in MB of every process spawned by this one: the
+    Playwright driver, the browser and its renderers. Shared pages are
+    counted once per process, so this is an upper bound. Returns None where
+    /proc is not available (macOS, Windows).
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces; fields resume after ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return total / (1024 * 1024)
+
+
+def rss_over_limit(rss_mb) -> bool:
+    """
+    Whether `rss_mb` calls for a recycle. Recycling a page only frees its
+    renderer, so the browser-wide total may stay above the limit afterwards;
+    once a recycle has happened, RSS must also have grown by
+    `recycle_rss_growth_mb` since then.
+    """
+    if rss_mb is None or rss_mb < RECYCLE_RSS_MB:
+        return False
+    if _rss_baseline_mb is None:
+        return True
+    return rss_mb - _rss_baseline_mb >= RECYCLE_RSS_GROWTH_MB
+
+
+def should_recycle(page, jobs_on_page) -> bool:
+    """Log browser-side memory telemetry and decide whether to recycle `page`."""
+    heap_mb = page_heap_mb(page)
+    rss_mb = browser_rss_mb()
+    rss_text = f"{rss_mb:.0f} MB" if rss_mb is not None else "n/a"
+    print(f"🧠 Memory: {heap_mb:.0f} MB JS heap, {rss_text} driver+browser RSS")
+    return (
+        jobs_on_page >= RECYCLE_AFTER_JOBS
+        or heap_mb >= RECYCLE_HEAP_MB
+        or rss_over_limit(rss_mb)
+    )
+
+
+def recycle_page(page):
+    """Close `page` and return a fresh page from the same context."""
+    global _rss_baseline_mb
+    context = page.context
+    print("♻️ Recycling page...")
+    try:
+        page.close()
+    except Exception as e:
+        print(f"⚠️ Error closing page: {e}")
+    new_page = context.new_page()
+    _rss_baseline_mb = browser_rss_mb()
+    return new_page
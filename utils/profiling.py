@@ -0,0 +1,205 @@
+"""Opt-in per-job profiling and Playwright trace capture.
+
+When `profiling.enabled` is false, `get_profiler` returns a no-op profiler
+and nothing is traced, profiled or written.
+"""
+import cProfile
+import json
+import os
+import re
+import time
+from contextlib import contextmanager, nullcontext
+
+import yaml
+
+with open("config.yaml") as f:
+    config = yaml.safe_load(f).get("profiling") or {}
+
+PROFILING_ENABLED = config.get("enabled", False)
+PROFILE_DIR = config.get("dir", "./profiles")
+MAX_DIR_MB = config.get("max_dir_mb", 500)
+PYTHON_PROFILE = config.get("python_profile", False)
+KEEP_SLOWEST = config.get("keep_slowest", 20)
+# Successful jobs at least this slow keep their trace too
+SLOW_JOB_S = config.get("slow_job_s", 60)
+INDEX_FILE = "index.json"
+
+
+class JobCapture:
+    """Per-job handle; the caller sets `success` before leaving the block."""
+
+    def __init__(self, job):
+        self.job = job
+        self.success = False
+
+
+class NullProfiler:
+    def job(self, job):
+        return nullcontext(JobCapture(job))
+
+
+class JobProfiler:
+    """
+    Captures a Playwright trace chunk per job and, optionally, a cProfile dump
+    of the Python side. The trace is kept when the job fails, takes at least
+    `slow_job_s`, or ranks among the slowest jobs. Captures go to a
+    size-capped directory with an index of the slowest jobs. Capture errors
+    are logged and never propagate to the caller.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.tracing = False
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        try:
+            context.tracing.start(screenshots=True, snapshots=True)
+            self.tracing = True
+        except Exception as e:
+            print(f"⚠️ Could not start Playwright tracing: {e}")
+
+    @contextmanager
+    def job(self, job):
+        capture = JobCapture(job)
+        job_id = str(job.get("job_id") or job.get("link") or "unknown")
+        stem = os.path.join(
+            PROFILE_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{_slug(job_id)}"
+        )
+
+        chunk_started = False
+        if self.tracing:
+            try:
+                self.context.tracing.start_chunk(title=job.get("title", job_id))
+                chunk_started = True
+            except Exception as e:
+                print(f"⚠️ Could not start trace chunk: {e}")
+        profiler = cProfile.Profile() if PYTHON_PROFILE else None
+        if profiler:
+            profiler.enable()
+        start = time.perf_counter()
+
+        try:
+            yield capture
+        finally:
+            duration = time.perf_counter() - start
+            files = []
+            if profiler:
+                profiler.disable()
+                try:
+                    profiler.dump_stats(f"{stem}.prof")
+                    files.append(f"{stem}.prof")
+                except Exception as e:
+                    print(f"⚠️ Could not save Python profile: {e}")
+
+            slowest = self._load_index()
+            if chunk_started:
+                keep = (
+                    not capture.success
+                    or duration >= SLOW_JOB_S
+                    or _ranks_among_slowest(slowest, duration)
+                )
+                try:
+                    if keep:
+                        self.context.tracing.stop_chunk(path=f"{stem}.trace.zip")
+                        files.append(f"{stem}.trace.zip")
+                    else:
+                        # Discard the chunk of a fast, successful job
+                        self.context.tracing.stop_chunk()
+                except Exception as e:
+                    print(f"⚠️ Could not save trace chunk: {e}")
+
+            print(f"⏱️ Job {job_id} took {duration:.1f}s")
+            try:
+                protected = self._update_index(
+                    slowest, job, job_id, duration, capture.success, files
+                )
+                self._rotate(protected)
+            except Exception as e:
+                print(f"⚠️ Could not update the profile index: {e}")
+
+    def _load_index(self):
+        """Return the slowest-jobs entries recorded so far."""
+        try:
+            with open(os.path.join(PROFILE_DIR, INDEX_FILE)) as f:
+                return json.load(f).get("slowest", [])
+        except Exception:
+            return []
+
+    def _update_index(self, slowest, job, job_id, duration, success, files):
+        """Record the job in the slowest-jobs index; return the files it references."""
+        slowest = slowest + [
+            {
+                "job_id": job_id,
+                "title": job.get("title", "Unknown"),
+                "company": job.get("company", "Unknown"),
+                "duration_s": round(duration, 3),
+                "success": success,
+                "captured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "files": files,
+            }
+        ]
+        slowest.sort(key=lambda e: e["duration_s"], reverse=True)
+        slowest = slowest[:KEEP_SLOWEST]
+
+        with open(os.path.join(PROFILE_DIR, INDEX_FILE), "w") as f:
+            json.dump({"slowest": slowest}, f, indent=4)
+
+        return {path for entry in slowest for path in entry["files"]}
+
+    def _rotate(self, protected):
+        """Delete the oldest captures until the directory is under the size cap."""
+        entries = []
+        for name in os.listdir(PROFILE_DIR):
+            if name == INDEX_FILE:
+                continue
+            path = os.path.join(PROFILE_DIR, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # Rotated by another process meanwhile
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        limit = MAX_DIR_MB * 1024 * 1024
+        if total <= limit:
+            return
+
+        entries.sort()
+        # Captures referenced by the slowest-jobs index go last
+        for keep_protected in (True, False):
+            for _, size, path in entries:
+                if total <= limit:
+                    return
+                if keep_protected and path in protected:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+
+_profiler = None
+
+
+def get_profiler(context):
+    """Return the profiler for `context`, or a no-op one when profiling is off."""
+    global _profiler
+    if not PROFILING_ENABLED:
+        return _NULL_PROFILER
+    if _profiler is None or _profiler.context is not context:
+        _profiler = JobProfiler(context)
+    return _profiler
+
+
+def _ranks_among_slowest(slowest, duration):
+    """Whether a job of `duration` seconds would enter the slowest-jobs index."""
+    if len(slowest) < KEEP_SLOWEST:
+        return True
+    return bool(slowest) and duration > min(e["duration_s"] for e in slowest)
+
+
+def _slug(value):
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", value)[-60:]
+
+
+_NULL_PROFILER = NullProfiler()
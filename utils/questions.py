@@ -0,0 +1,153 @@
+"""Cluster accumulated unanswered screening questions.
+
+Reads `questions.json`, groups near-duplicate labels and ranks the groups
+by how many failed applications they caused, so the few answers that
+unblock most applications can be added first. Run from the repo root:
+
+    python -m utils.questions --threshold 85 --top 20
+"""
+import argparse
+import json
+import re
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+QUESTIONS_FILE = "questions.json"
+SUGGESTIONS_FILE = "suggested_answers.json"
+# Rows scored per cdist call; bounds the score matrix to BLOCK_SIZE x N bytes
+BLOCK_SIZE = 1024
+
+
+def normalize_question(label: str) -> str:
+    """Lowercase, mask numbers and strip punctuation so variants compare equal."""
+    text = label.lower()
+    text = re.sub(r"\d+(?:[.,]\d+)?", "#", text)
+    text = re.sub(r"[^\w#\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def load_questions(path=QUESTIONS_FILE):
+    """Return {label: (occurrences, failures)} for every unanswered label."""
+    with open(path) as f:
+        data = json.load(f)
+
+    occurrences = data.get("unanswered_counts", {})
+    failures = data.get("failed_counts", {})
+    # Files written before counts were tracked only have the label list
+    return {
+        label: (occurrences.get(label, 1), failures.get(label, 0))
+        for label in data.get("unanswered_questions", [])
+        if label.strip()
+    }
+
+
+def cluster_questions(questions, threshold=85):
+    """
+    Group labels whose normalized forms score >= `threshold` on sorted
+    tokens (token_sort_ratio, with tokens sorted once up front so cdist can
+    use plain `fuzz.ratio`). Most frequent labels become cluster leaders
+    first; scores are computed in blocks with `process.cdist`, only against
+    labels that are still unassigned.
+    """
+    # Collapse labels that normalize identically before the fuzzy pass
+    by_norm = {}
+    for label, (count, failed) in questions.items():
+        entry = by_norm.setdefault(normalize_question(label), [[], 0, 0])
+        entry[0].append(label)
+        entry[1] += count
+        entry[2] += failed
+
+    norms = list(by_norm)
+    keys = [" ".join(sorted(n.split())) for n in norms]
+    counts = np.array([by_norm[n][1] for n in norms], dtype=np.int64)
+    order = np.argsort(-counts, kind="stable")
+    assigned = np.full(len(norms), -1, dtype=np.int64)
+
+    for start in range(0, len(order), BLOCK_SIZE):
+        rows = [i for i in order[start : start + BLOCK_SIZE] if assigned[i] < 0]
+        if not rows:
+            continue
+        remaining = np.flatnonzero(assigned < 0)
+        scores = process.cdist(
+            [keys[i] for i in rows],
+            [keys[j] for j in remaining],
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            dtype=np.uint8,
+            workers=-1,
+        )
+        for r, leader in enumerate(rows):
+            if assigned[leader] >= 0:
+                continue
+            # score_cutoff zeroes everything below the threshold
+            members = remaining[np.flatnonzero(scores[r])]
+            members = members[assigned[members] < 0]
+            assigned[members] = leader
+            assigned[leader] = leader
+
+    clusters = {}
+    for i, leader in enumerate(assigned):
+        labels, count, failed = by_norm[norms[i]]
+        cluster = clusters.setdefault(
+            leader,
+            {
+                "representative": by_norm[norms[leader]][0][0],
+                "variants": [],
+                "occurrences": 0,
+                "failed_applications": 0,
+            },
+        )
+        cluster["variants"].extend(labels)
+        cluster["occurrences"] += count
+        cluster["failed_applications"] += failed
+
+    return sorted(
+        clusters.values(),
+        key=lambda c: (c["failed_applications"], c["occurrences"]),
+        reverse=True,
+    )
+
+
+def export_suggestions(clusters, path=SUGGESTIONS_FILE, top=None):
+    """Write answer-bank entries to fill in, one per cluster."""
+    entries = [
+        {
+            "question": c["representative"],
+            "keywords": sorted({normalize_question(v) for v in c["variants"]})[:10],
+            "occurrences": c["occurrences"],
+            "failed_applications": c["failed_applications"],
+            "variants": len(c["variants"]),
+            "answer": None,
+        }
+        for c in clusters[:top]
+    ]
+    with open(path, "w") as f:
+        json.dump(entries, f, indent=4)
+    print(f"💾 Wrote {len(entries)} suggested answer-bank entries to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--input", default=QUESTIONS_FILE)
+    parser.add_argument("--output", default=SUGGESTIONS_FILE)
+    parser.add_argument("--threshold", type=int, default=85)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    questions = load_questions(args.input)
+    clusters = cluster_questions(questions, args.threshold)
+    print(f"🧩 {len(questions)} unanswered labels -> {len(clusters)} clusters")
+
+    for rank, c in enumerate(clusters[: args.top], start=1):
+        print(
+            f"{rank:>3}. failed={c['failed_applications']:<5} "
+            f"seen={c['occurrences']:<5} variants={len(c['variants']):<4} "
+            f"{c['representative'][:80]}"
+        )
+
+    export_suggestions(clusters, args.output, top=args.top)
+
+
+if __name__ == "__main__":
+    main()
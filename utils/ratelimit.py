@@ -0,0 +1,135 @@
+"""Global token-bucket rate limiter.
+
+Buckets live in a local SQLite database, so every tab and every process on
+the machine draws from the same budget. Call `acquire(action)` right before
+the throttled action; it blocks until a token is available.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+import yaml
+
+with open("config.yaml") as f:
+    config = yaml.safe_load(f).get("rate_limits") or {}
+
+RATE_LIMIT_ENABLED = config.get("enabled", True)
+DB_PATH = config.get("db_path", "./user_data/ratelimit.db")
+DEFAULT_BUCKETS = {
+    "navigation": {"per_minute": 12, "burst": 4},
+    "search": {"per_minute": 2, "burst": 1},
+    "submit": {"per_minute": 3, "burst": 1},
+}
+BUCKETS = {**DEFAULT_BUCKETS, **(config.get("buckets") or {})}
+
+
+def _validate_buckets(buckets):
+    for name, bucket in buckets.items():
+        per_minute = bucket.get("per_minute")
+        if not isinstance(per_minute, (int, float)) or per_minute <= 0:
+            raise ValueError(
+                f"rate_limits.buckets.{name}.per_minute must be a positive number, "
+                f"got {per_minute!r}"
+            )
+        burst = bucket.get("burst", 1)
+        if not isinstance(burst, (int, float)) or burst < 1:
+            raise ValueError(
+                f"rate_limits.buckets.{name}.burst must be at least 1, got {burst!r}"
+            )
+
+
+_validate_buckets(BUCKETS)
+
+# Seconds this process spent waiting in the limiter, per action class
+wait_seconds: dict[str, float] = defaultdict(float)
+
+_local = threading.local()
+
+
+def _connect():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly below
+        conn = sqlite3.connect(DB_PATH, timeout=30, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets "
+            "(name TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS waits "
+            "(name TEXT PRIMARY KEY, total_wait REAL, acquisitions INTEGER)"
+        )
+        _local.conn = conn
+    return conn
+
+
+def acquire(action: str) -> float:
+    """
+    Take one token from the `action` bucket, sleeping until it is available.
+    The token is reserved inside a single write transaction (the balance may
+    go negative), so concurrent callers queue up instead of racing.
+    Returns the seconds spent waiting.
+    """
+    if not RATE_LIMIT_ENABLED:
+        return 0.0
+
+    bucket = BUCKETS[action]
+    rate = bucket["per_minute"] / 60.0
+    burst = bucket.get("burst", 1)
+
+    conn = _connect()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        now = time.time()
+        row = conn.execute(
+            "SELECT tokens, updated FROM buckets WHERE name = ?", (action,)
+        ).fetchone()
+        tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+        tokens -= 1
+        delay = max(0.0, -tokens / rate)
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+            (action, tokens, now),
+        )
+        conn.execute(
+            "INSERT INTO waits (name, total_wait, acquisitions) VALUES (?, ?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET "
+            "total_wait = total_wait + excluded.total_wait, "
+            "acquisitions = acquisitions + 1",
+            (action, delay),
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    if delay > 0:
+        print(f"🚦 Rate limit: waiting {delay:.1f}s before {action}")
+        time.sleep(delay)
+    wait_seconds[action] += delay
+    return delay
+
+
+def limiter_metrics() -> dict[str, dict]:
+    """Wait time per action: this process and all processes sharing the DB."""
+    metrics = {
+        action: {"process_wait_s": round(waited, 2)}
+        for action, waited in wait_seconds.items()
+    }
+    if RATE_LIMIT_ENABLED:
+        rows = _connect().execute(
+            "SELECT name, total_wait, acquisitions FROM waits"
+        ).fetchall()
+        for name, total_wait, acquisitions in rows:
+            entry = metrics.setdefault(name, {"process_wait_s": 0.0})
+            entry["global_wait_s"] = round(total_wait, 2)
+            entry["global_acquisitions"] = acquisitions
+    return metrics
+
+
+def print_limiter_metrics():
+    for action, entry in sorted(limiter_metrics().items()):
+        print(f"🚦 {action}: {entry}")
@@ -1,33 +1,50 @@
 import yaml
 
 from utils.humanize import random_sleep
-from utils.login import wait_for_page_full_load
+from utils.login import SessionExpired, is_auth_redirect, wait_for_page_full_load
+from utils.ratelimit import acquire
 
 with open("config.yaml") as f:
     config = yaml.safe_load(f)["job_search"]
 
 
-def search_easy_apply_jobs(page, scroll_times=10):
+def search_easy_apply_jobs(page, scroll_times=10, seen_ids=None):
+    """Collect all Easy Apply jobs from the configured search."""
+    return list(iter_easy_apply_jobs(page, scroll_times, seen_ids))
+
+
+def iter_easy_apply_jobs(page, scroll_times=10, seen_ids=None):
+    """
+    Yield Easy Apply jobs from the configured search as they appear.
+    Cards are extracted after every scroll so callers can start applying
+    before the list is exhausted. Job ids in `seen_ids` are skipped, and
+    every yielded id is added to it.
+    """
+    if seen_ids is None:
+        seen_ids = set()
+
     print("🔍 Searching for Easy Apply jobs")
+    acquire("search")
     page.goto(config["url"])
+    if is_auth_redirect(page):
+        raise SessionExpired(f"Redirected to {page.url}")
     wait_for_page_full_load(page)
     random_sleep()
 
-    # Find the scroll container after the sentinel div
-    sentinel = page.query_selector("div[data-results-list-top-scroll-sentinel]")
-    if not sentinel:
+    # The job list is the element right after the sentinel div (dynamic class
+    # name). Locators hold no remote references, so nothing needs disposing.
+    sentinel = page.locator("div[data-results-list-top-scroll-sentinel]").first
+    if not sentinel.count():
         raise Exception("❌ Could not find job results sentinel container.")
 
-    # The next sibling <ul> is the job list container (dynamic class name)
-    ul_container = sentinel.evaluate_handle("el => el.nextElementSibling")
-    if not ul_container:
+    ul_container = sentinel.locator("xpath=following-sibling::*[1]")
+    if not ul_container.count():
         raise Exception("❌ Could not find job list container <ul>.")
 
     # Bring the UL into view and focus it to simulate human interaction
-    page.evaluate(
-        "(el) => el.scrollIntoView({block: 'center', inline: 'center'})", ul_container
+    ul_container.evaluate(
+        "(el) => { el.scrollIntoView({block: 'center', inline: 'center'}); el.focus(); }"
     )
-    page.evaluate("(el) => el.focus()", ul_container)
     random_sleep()
 
     # Move mouse over it
@@ -37,56 +54,78 @@ def search_easy_apply_jobs(page, scroll_times=10):
         page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
         print("🖱️ Hovered and focused job list container.")
 
+    collected = 0
+    for job in extract_job_cards(page, seen_ids):
+        collected += 1
+        yield job
+
     # Perform controlled scrolls inside the UL container
     for i in range(scroll_times):
         print(f"📜 Scrolling job list... ({i + 1}/{scroll_times})")
-        page.evaluate(
-            """(ul) => { ul.scrollBy(0, ul.scrollHeight / 2); }""", ul_container
-        )
+        ul_container.evaluate("(ul) => { ul.scrollBy(0, ul.scrollHeight / 2); }")
         random_sleep()
 
-    # Extract job cards
+        for job in extract_job_cards(page, seen_ids):
+            collected += 1
+            yield job
+
+    print(f"✅ Collected {collected} new Easy Apply jobs.")
+
+
+# Reads every card in a single round-trip instead of one handle per field
+EXTRACT_CARDS_JS = """
+(cards) => cards.map((div) => {
+    const titleEl = div.querySelector("a.job-card-container__link");
+    const companyEl = div.querySelector(".artdeco-entity-lockup__subtitle");
+    const occludable = div.closest("[data-occludable-job-id]");
+    return {
+        job_id: div.getAttribute("data-job-id")
+            || (occludable && occludable.getAttribute("data-occludable-job-id")),
+        title: titleEl ? titleEl.innerText.split("\\n")[0].trim() : "Unknown",
+        link: titleEl ? titleEl.getAttribute("href") : null,
+        company: companyEl ? companyEl.innerText.trim() : "Unknown",
+        easy_apply: Array.from(div.querySelectorAll("li")).some(
+            (li) => li.textContent.toLowerCase().includes("easy apply")
+        ),
+    };
+})
+"""
+
+
+def extract_job_cards(page, seen_ids):
+    """Extract Easy Apply jobs from the rendered cards that are not in `seen_ids`."""
     print("🔍 Extracting visible job cards...")
 
     jobs = []
-    job_divs = page.query_selector_all("div[data-job-id]")
+    cards = page.locator("div[data-job-id]")
 
-    if not job_divs:
+    if not cards.count():
         print("⚠️ No job cards found. Trying fallback selector...")
-        job_divs = page.query_selector_all(
-            "li[data-occludable-job-id] div.job-card-container"
-        )
-
-    print(f"🧩 Found {len(job_divs)} job card containers.")
-
-    for div in job_divs:
-        try:
-            title_el = div.query_selector("a.job-card-container__link")
-            company_el = div.query_selector(".artdeco-entity-lockup__subtitle")
-            easy_apply_el = div.query_selector("li:has-text('Easy Apply')")
-
-            title = (
-                title_el.inner_text().split("\n")[0].strip().strip()
-                if title_el
-                else "Unknown"
-            )
-            link = title_el.get_attribute("href") if title_el else None
-            company = company_el.inner_text().strip() if company_el else "Unknown"
-
-            easy_apply = easy_apply_el is not None
-            if easy_apply and link:
-                jobs.append(
-                    {
-                        "title": title,
-                        "company": company,
-                        "link": "https://www.linkedin.com" + link,
-                    }
-                )
-        except TimeoutError:
-            continue
-        except Exception as e:
-            print(f"⚠️ Error parsing job card: {e}")
+        cards = page.locator("li[data-occludable-job-id] div.job-card-container")
+
+    try:
+        parsed = cards.evaluate_all(EXTRACT_CARDS_JS)
+    except Exception as e:
+        print(f"⚠️ Error parsing job cards: {e}")
+        return jobs
+
+    print(f"🧩 Found {len(parsed)} job card containers.")
+
+    for card in parsed:
+        # Remember non-Easy-Apply cards too so they are not re-parsed
+        job_id = card["job_id"] or card["link"]
+        if not job_id or job_id in seen_ids:
             continue
+        seen_ids.add(job_id)
+
+        if card["easy_apply"] and card["link"]:
+            jobs.append(
+                {
+                    "job_id": job_id,
+                    "title": card["title"],
+                    "company": card["company"],
+                    "link": "https://www.linkedin.com" + card["link"],
+                }
+            )
 
-    print(f"✅ Collected {len(jobs)} Easy Apply jobs.")
     return jobs